@@ -9,6 +9,7 @@ from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Body
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from ..models import (
     WebhookSignal,
@@ -30,12 +31,21 @@ logger = logging.getLogger(__name__)
 # Create webhook router
 webhook_router = APIRouter(prefix="/webhook", tags=["webhook"])
 
+# Validates raw webhook bodies straight from JSON bytes in pydantic-core
+_PAYLOAD_ADAPTER = TypeAdapter(WebhookSignalPayload)
 
-@webhook_router.post("/signal", response_model=ApiResponse[Dict[str, Any]])
-async def receive_deribit_style_signal(
-    request: Request,
-    payload: WebhookSignalPayload = Body(...)
-):
+
+@webhook_router.post(
+    "/signal",
+    response_model=ApiResponse[Dict[str, Any]],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": WebhookSignalPayload.model_json_schema()}},
+        }
+    },
+)
+async def receive_deribit_style_signal(request: Request):
     """
     Receive trading signal from TradingView webhook (deribit_webhook compatible format)
 
@@ -43,6 +53,13 @@ async def receive_deribit_style_signal(
     The signal includes account name in the payload and follows the deribit format.
     """
 
+    try:
+        payload = _PAYLOAD_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
     request_id = f"req_{int(datetime.now().timestamp() * 1000)}_{hash(str(payload)) % 10000:04d}"
 
     logger.info(
@@ -65,6 +65,7 @@ class Settings(BaseSettings):
     # Webhook Configuration
     webhook_secret: Optional[str] = Field(default=None, description="Webhook secret for validation")
     webhook_timeout: int = Field(default=30, description="Webhook timeout in seconds")
+    signal_concurrency: int = Field(default=10, description="Maximum queued signals executed concurrently")
     
     # Monitoring and Alerts
     enable_metrics: bool = Field(default=True, description="Enable metrics collection")
@@ -4,7 +4,9 @@ Main entry point for the FastAPI application
 """
 
 import logging
+import queue
 import uvicorn
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -27,12 +29,36 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
 logger = logging.getLogger(__name__)
 
 
+def _start_log_listener() -> QueueListener:
+    """
+    Hand root log records to the configured handlers on a listener thread
+
+    Logging on the request path then only enqueues and never blocks the
+    event loop on I/O. Undo with _stop_log_listener.
+    """
+    log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush queued records and give the root logger its handlers back"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
+    log_listener = _start_log_listener()
+
     # Startup
     logger.info("Starting Tiger Options Trading Service...")
 
@@ -63,6 +89,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Tiger Options Trading Service...")
+    _stop_log_listener(log_listener)
 
 
 def create_app() -> FastAPI:
@@ -21,6 +21,7 @@ from .tiger import (
     OrderStatus,
     TimeInForce,
     OptionType,
+    SignalAction,
     TigerAccount,
     OptionContract,
     TigerOrder,
@@ -62,6 +63,7 @@ __all__ = [
     "OrderStatus",
     "TimeInForce",
     "OptionType",
+    "SignalAction",
     "TigerAccount",
     "OptionContract",
     "TigerOrder",
@@ -2,14 +2,31 @@
 Common data models and utilities
 """
 
+import os
 from datetime import datetime
-from typing import Optional, Generic, TypeVar, List, Dict, Any
+from typing import Annotated, Optional, Generic, TypeVar, List, Dict, Any
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer
 from pydantic.generics import GenericModel
 
 
+# Field descriptions are only kept when the schema is published; otherwise
+# pydantic would hold every description string on its FieldInfo for the
+# lifetime of the process.
+_DESC = (lambda s: s) if os.getenv("EXPOSE_SCHEMA") else (lambda s: None)
+
+# Decimal and datetime fields that serialize to strings in JSON output and stay
+# native in python-mode dumps
+JsonDecimal = Annotated[
+    Decimal, PlainSerializer(str, return_type=str, when_used="json-unless-none")
+]
+JsonDatetime = Annotated[
+    datetime,
+    PlainSerializer(datetime.isoformat, return_type=str, when_used="json-unless-none"),
+]
+
+
 T = TypeVar('T')
 
 
@@ -20,13 +37,8 @@ class ApiResponse(GenericModel, Generic[T]):
     message: str = Field(description="Response message")
     data: Optional[T] = Field(default=None, description="Response data")
     error: Optional[str] = Field(default=None, description="Error message")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: JsonDatetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
     request_id: Optional[str] = Field(default=None, description="Request ID for tracking")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class HealthStatus(BaseModel):
@@ -35,7 +47,7 @@ class HealthStatus(BaseModel):
     status: str = Field(description="Overall status")
     service: str = Field(description="Service name")
     version: str = Field(description="Service version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
+    timestamp: JsonDatetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
     
     # Component statuses
     database: Optional[str] = Field(default=None, description="Database status")
@@ -45,11 +57,6 @@ class HealthStatus(BaseModel):
     uptime: Optional[float] = Field(default=None, description="Uptime in seconds")
     memory_usage: Optional[float] = Field(default=None, description="Memory usage percentage")
     cpu_usage: Optional[float] = Field(default=None, description="CPU usage percentage")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ServiceStatus(BaseModel):
@@ -58,7 +65,7 @@ class ServiceStatus(BaseModel):
     service_name: str = Field(description="Service name")
     version: str = Field(description="Service version")
     environment: str = Field(description="Environment (dev/test/prod)")
-    started_at: datetime = Field(description="Service start time")
+    started_at: JsonDatetime = Field(description="Service start time")
     
     # Configuration status
     mock_mode: bool = Field(description="Whether mock mode is enabled")
@@ -73,11 +80,6 @@ class ServiceStatus(BaseModel):
     uptime_seconds: float = Field(description="Uptime in seconds")
     memory_usage_mb: Optional[float] = Field(default=None, description="Memory usage in MB")
     cpu_usage_percent: Optional[float] = Field(default=None, description="CPU usage percentage")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ErrorDetail(BaseModel):
@@ -86,7 +88,7 @@ class ErrorDetail(BaseModel):
     error_code: str = Field(description="Error code")
     error_message: str = Field(description="Error message")
     error_type: str = Field(description="Error type")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: JsonDatetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
     
     # Context information
     request_id: Optional[str] = Field(default=None, description="Request ID")
@@ -95,11 +97,6 @@ class ErrorDetail(BaseModel):
     
     # Stack trace (for debugging)
     stack_trace: Optional[str] = Field(default=None, description="Stack trace")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class PaginationParams(BaseModel):
@@ -150,7 +147,7 @@ class PaginatedResponse(GenericModel, Generic[T]):
 class MetricsData(BaseModel):
     """System metrics data"""
     
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Metrics timestamp")
+    timestamp: JsonDatetime = Field(default_factory=datetime.utcnow, description="Metrics timestamp")
     
     # System metrics
     cpu_usage_percent: float = Field(description="CPU usage percentage")
@@ -168,11 +165,6 @@ class MetricsData(BaseModel):
     total_orders: int = Field(description="Total number of orders")
     successful_orders: int = Field(description="Number of successful orders")
     failed_orders: int = Field(description="Number of failed orders")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ConfigValidationResult(BaseModel):
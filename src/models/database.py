@@ -2,196 +2,205 @@
 Database models for Tiger Options Trading Service
 """
 
+import json
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, Dict, Any
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .common import _DESC, JsonDatetime, JsonDecimal
 
 
 class TradeRecord(BaseModel):
     """Trade record model"""
     
     # Primary key
-    id: Optional[int] = Field(default=None, description="Record ID")
+    id: Optional[int] = Field(default=None, description=_DESC("Record ID"))
     
     # Trade identification
-    trade_id: str = Field(description="Unique trade ID")
-    order_id: str = Field(description="Order ID")
-    account_name: str = Field(description="Account name")
+    trade_id: str = Field(description=_DESC("Unique trade ID"))
+    order_id: str = Field(description=_DESC("Order ID"))
+    account_name: str = Field(description=_DESC("Account name"))
     
     # Instrument information
-    symbol: str = Field(description="Symbol")
-    underlying_symbol: Optional[str] = Field(default=None, description="Underlying symbol")
-    instrument_type: str = Field(description="Instrument type (stock/option)")
+    symbol: str = Field(description=_DESC("Symbol"))
+    underlying_symbol: Optional[str] = Field(default=None, description=_DESC("Underlying symbol"))
+    instrument_type: str = Field(description=_DESC("Instrument type (stock/option)"))
     
     # Trade details
-    side: str = Field(description="Trade side (buy/sell)")
-    quantity: Decimal = Field(description="Trade quantity")
-    price: Decimal = Field(description="Trade price")
-    amount: Decimal = Field(description="Trade amount")
-    currency: str = Field(description="Currency")
+    side: str = Field(description=_DESC("Trade side (buy/sell)"))
+    quantity: JsonDecimal = Field(description=_DESC("Trade quantity"))
+    price: JsonDecimal = Field(description=_DESC("Trade price"))
+    amount: JsonDecimal = Field(description=_DESC("Trade amount"))
+    currency: str = Field(description=_DESC("Currency"))
     
     # Option specific fields
-    option_type: Optional[str] = Field(default=None, description="Option type (call/put)")
-    strike_price: Optional[Decimal] = Field(default=None, description="Strike price")
-    expiry_date: Optional[datetime] = Field(default=None, description="Expiry date")
+    option_type: Optional[str] = Field(default=None, description=_DESC("Option type (call/put)"))
+    strike_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Strike price"))
+    expiry_date: Optional[JsonDatetime] = Field(default=None, description=_DESC("Expiry date"))
     
     # Fees and costs
-    commission: Optional[Decimal] = Field(default=None, description="Commission")
-    fees: Optional[Decimal] = Field(default=None, description="Other fees")
+    commission: Optional[JsonDecimal] = Field(default=None, description=_DESC("Commission"))
+    fees: Optional[JsonDecimal] = Field(default=None, description=_DESC("Other fees"))
     
     # Timestamps
-    trade_time: datetime = Field(description="Trade execution time")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Record creation time")
+    trade_time: JsonDatetime = Field(description=_DESC("Trade execution time"))
+    created_at: JsonDatetime = Field(default_factory=datetime.utcnow, description=_DESC("Record creation time"))
     
     # Metadata
-    strategy_id: Optional[str] = Field(default=None, description="Strategy ID")
-    signal_id: Optional[str] = Field(default=None, description="Signal ID")
-    notes: Optional[str] = Field(default=None, description="Additional notes")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    strategy_id: Optional[str] = Field(default=None, description=_DESC("Strategy ID"))
+    signal_id: Optional[str] = Field(default=None, description=_DESC("Signal ID"))
+    notes: Optional[str] = Field(default=None, description=_DESC("Additional notes"))
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class PositionRecord(BaseModel):
     """Position record model"""
     
     # Primary key
-    id: Optional[int] = Field(default=None, description="Record ID")
+    id: Optional[int] = Field(default=None, description=_DESC("Record ID"))
     
     # Position identification
-    account_name: str = Field(description="Account name")
-    symbol: str = Field(description="Symbol")
-    underlying_symbol: Optional[str] = Field(default=None, description="Underlying symbol")
-    instrument_type: str = Field(description="Instrument type")
+    account_name: str = Field(description=_DESC("Account name"))
+    symbol: str = Field(description=_DESC("Symbol"))
+    underlying_symbol: Optional[str] = Field(default=None, description=_DESC("Underlying symbol"))
+    instrument_type: str = Field(description=_DESC("Instrument type"))
     
     # Position details
-    quantity: Decimal = Field(description="Position quantity")
-    avg_cost: Decimal = Field(description="Average cost")
-    market_price: Optional[Decimal] = Field(default=None, description="Current market price")
-    market_value: Optional[Decimal] = Field(default=None, description="Current market value")
+    quantity: JsonDecimal = Field(description=_DESC("Position quantity"))
+    avg_cost: JsonDecimal = Field(description=_DESC("Average cost"))
+    market_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Current market price"))
+    market_value: Optional[JsonDecimal] = Field(default=None, description=_DESC("Current market value"))
     
     # P&L information
-    unrealized_pnl: Optional[Decimal] = Field(default=None, description="Unrealized P&L")
-    realized_pnl: Optional[Decimal] = Field(default=None, description="Realized P&L")
+    unrealized_pnl: Optional[JsonDecimal] = Field(default=None, description=_DESC("Unrealized P&L"))
+    realized_pnl: Optional[JsonDecimal] = Field(default=None, description=_DESC("Realized P&L"))
     
     # Option specific fields
-    option_type: Optional[str] = Field(default=None, description="Option type")
-    strike_price: Optional[Decimal] = Field(default=None, description="Strike price")
-    expiry_date: Optional[datetime] = Field(default=None, description="Expiry date")
+    option_type: Optional[str] = Field(default=None, description=_DESC("Option type"))
+    strike_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Strike price"))
+    expiry_date: Optional[JsonDatetime] = Field(default=None, description=_DESC("Expiry date"))
     
     # Greeks (for options)
-    delta: Optional[Decimal] = Field(default=None, description="Delta")
-    gamma: Optional[Decimal] = Field(default=None, description="Gamma")
-    theta: Optional[Decimal] = Field(default=None, description="Theta")
-    vega: Optional[Decimal] = Field(default=None, description="Vega")
-    implied_volatility: Optional[Decimal] = Field(default=None, description="Implied volatility")
+    delta: Optional[JsonDecimal] = Field(default=None, description=_DESC("Delta"))
+    gamma: Optional[JsonDecimal] = Field(default=None, description=_DESC("Gamma"))
+    theta: Optional[JsonDecimal] = Field(default=None, description=_DESC("Theta"))
+    vega: Optional[JsonDecimal] = Field(default=None, description=_DESC("Vega"))
+    implied_volatility: Optional[JsonDecimal] = Field(default=None, description=_DESC("Implied volatility"))
     
     # Timestamps
-    position_date: datetime = Field(description="Position date")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
+    position_date: JsonDatetime = Field(description=_DESC("Position date"))
+    updated_at: JsonDatetime = Field(default_factory=datetime.utcnow, description=_DESC("Last update time"))
     
     # Metadata
-    currency: str = Field(description="Currency")
-    multiplier: int = Field(default=1, description="Contract multiplier")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    currency: str = Field(description=_DESC("Currency"))
+    multiplier: int = Field(default=1, description=_DESC("Contract multiplier"))
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class OrderRecord(BaseModel):
     """Order record model"""
     
     # Primary key
-    id: Optional[int] = Field(default=None, description="Record ID")
+    id: Optional[int] = Field(default=None, description=_DESC("Record ID"))
     
     # Order identification
-    order_id: str = Field(description="Order ID")
-    account_name: str = Field(description="Account name")
+    order_id: str = Field(description=_DESC("Order ID"))
+    account_name: str = Field(description=_DESC("Account name"))
     
     # Instrument information
-    symbol: str = Field(description="Symbol")
-    underlying_symbol: Optional[str] = Field(default=None, description="Underlying symbol")
-    instrument_type: str = Field(description="Instrument type")
+    symbol: str = Field(description=_DESC("Symbol"))
+    underlying_symbol: Optional[str] = Field(default=None, description=_DESC("Underlying symbol"))
+    instrument_type: str = Field(description=_DESC("Instrument type"))
     
     # Order details
-    order_type: str = Field(description="Order type")
-    side: str = Field(description="Order side")
-    quantity: Decimal = Field(description="Order quantity")
-    price: Optional[Decimal] = Field(default=None, description="Order price")
-    stop_price: Optional[Decimal] = Field(default=None, description="Stop price")
-    time_in_force: str = Field(description="Time in force")
+    order_type: str = Field(description=_DESC("Order type"))
+    side: str = Field(description=_DESC("Order side"))
+    quantity: JsonDecimal = Field(description=_DESC("Order quantity"))
+    price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Order price"))
+    stop_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Stop price"))
+    time_in_force: str = Field(description=_DESC("Time in force"))
     
     # Order status
-    status: str = Field(description="Order status")
-    filled_quantity: Decimal = Field(default=Decimal('0'), description="Filled quantity")
-    avg_fill_price: Optional[Decimal] = Field(default=None, description="Average fill price")
+    status: str = Field(description=_DESC("Order status"))
+    filled_quantity: JsonDecimal = Field(default=Decimal('0'), description=_DESC("Filled quantity"))
+    avg_fill_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Average fill price"))
     
     # Option specific fields
-    option_type: Optional[str] = Field(default=None, description="Option type")
-    strike_price: Optional[Decimal] = Field(default=None, description="Strike price")
-    expiry_date: Optional[datetime] = Field(default=None, description="Expiry date")
+    option_type: Optional[str] = Field(default=None, description=_DESC("Option type"))
+    strike_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Strike price"))
+    expiry_date: Optional[JsonDatetime] = Field(default=None, description=_DESC("Expiry date"))
     
     # Timestamps
-    created_at: datetime = Field(description="Order creation time")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
-    filled_at: Optional[datetime] = Field(default=None, description="Fill time")
+    created_at: JsonDatetime = Field(description=_DESC("Order creation time"))
+    updated_at: JsonDatetime = Field(default_factory=datetime.utcnow, description=_DESC("Last update time"))
+    filled_at: Optional[JsonDatetime] = Field(default=None, description=_DESC("Fill time"))
     
     # Metadata
-    currency: str = Field(description="Currency")
-    commission: Optional[Decimal] = Field(default=None, description="Commission")
-    signal_id: Optional[str] = Field(default=None, description="Signal ID")
-    strategy_id: Optional[str] = Field(default=None, description="Strategy ID")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    currency: str = Field(description=_DESC("Currency"))
+    commission: Optional[JsonDecimal] = Field(default=None, description=_DESC("Commission"))
+    signal_id: Optional[str] = Field(default=None, description=_DESC("Signal ID"))
+    strategy_id: Optional[str] = Field(default=None, description=_DESC("Strategy ID"))
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class SignalRecord(BaseModel):
     """Signal record model"""
     
     # Primary key
-    id: Optional[int] = Field(default=None, description="Record ID")
+    id: Optional[int] = Field(default=None, description=_DESC("Record ID"))
     
     # Signal identification
-    signal_id: str = Field(description="Unique signal ID")
-    account_name: str = Field(description="Account name")
+    signal_id: str = Field(description=_DESC("Unique signal ID"))
+    account_name: str = Field(description=_DESC("Account name"))
     
     # Signal details
-    symbol: str = Field(description="Symbol")
-    side: str = Field(description="Signal side")
-    action: str = Field(description="Signal action")
-    quantity: Decimal = Field(description="Signal quantity")
-    price: Decimal = Field(description="Signal price")
+    symbol: str = Field(description=_DESC("Symbol"))
+    side: str = Field(description=_DESC("Signal side"))
+    action: str = Field(description=_DESC("Signal action"))
+    quantity: JsonDecimal = Field(description=_DESC("Signal quantity"))
+    price: JsonDecimal = Field(description=_DESC("Signal price"))
     
-    # Original webhook data
-    webhook_payload: Dict[str, Any] = Field(description="Original webhook payload")
+    # Original webhook data, stored as the raw JSON body
+    webhook_payload_raw: bytes = Field(description=_DESC("Original webhook payload (raw JSON)"))
     
     # Processing status
-    status: str = Field(description="Processing status")
-    error_message: Optional[str] = Field(default=None, description="Error message")
+    status: str = Field(description=_DESC("Processing status"))
+    error_message: Optional[str] = Field(default=None, description=_DESC("Error message"))
     
     # Results
-    orders_created: Optional[int] = Field(default=None, description="Number of orders created")
-    total_quantity_filled: Optional[Decimal] = Field(default=None, description="Total quantity filled")
+    orders_created: Optional[int] = Field(default=None, description=_DESC("Number of orders created"))
+    total_quantity_filled: Optional[JsonDecimal] = Field(default=None, description=_DESC("Total quantity filled"))
     
     # Timestamps
-    received_at: datetime = Field(description="Signal received time")
-    processed_at: Optional[datetime] = Field(default=None, description="Signal processed time")
-    completed_at: Optional[datetime] = Field(default=None, description="Signal completed time")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    received_at: JsonDatetime = Field(description=_DESC("Signal received time"))
+    processed_at: Optional[JsonDatetime] = Field(default=None, description=_DESC("Signal processed time"))
+    completed_at: Optional[JsonDatetime] = Field(default=None, description=_DESC("Signal completed time"))
+    
+    @cached_property
+    def webhook_payload(self) -> Dict[str, Any]:
+        """Get original webhook payload as a dict"""
+        return json.loads(self.webhook_payload_raw)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
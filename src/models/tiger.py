@@ -2,12 +2,22 @@
 Tiger Brokers API data models
 """
 
+import json
+import re
 from datetime import datetime
-from typing import Optional, List, Literal, Dict, Any
+from functools import cached_property
+from typing import Optional, List, Dict, Any
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    validator,
+)
+
+from .common import _DESC, JsonDatetime, JsonDecimal
 
 
 class Market(str, Enum):
@@ -65,51 +75,73 @@ class OptionType(str, Enum):
     PUT = "put"
 
 
+class SignalAction(str, Enum):
+    """Trading signal action enumeration"""
+    OPEN = "open"
+    CLOSE = "close"
+    REVERSE = "reverse"
+
+
+# Decimal multiplication is cheaper than division with context rounding
+_D_HALF = Decimal("0.5")
+
+# OCC-style option symbol, matched with fullmatch: underlying, YYMMDD expiry,
+# C/P, strike x 1000 in the trailing 8 digits
+OCC_SYMBOL_RE = re.compile(r"(\S+)\s+(\d{6})([CP])\d*(\d{8})")
+
+_ACTIVE_ORDER_STATUSES = frozenset({
+    OrderStatus.PENDING,
+    OrderStatus.SUBMITTED,
+    OrderStatus.PARTIAL_FILLED,
+})
+
+
 class TigerAccount(BaseModel):
     """Tiger account information"""
     
-    account: str = Field(description="Account number")
-    currency: Currency = Field(description="Account currency")
-    buying_power: Decimal = Field(description="Buying power")
-    cash: Decimal = Field(description="Cash balance")
-    market_value: Decimal = Field(description="Market value")
-    net_liquidation: Decimal = Field(description="Net liquidation value")
+    account: str = Field(description=_DESC("Account number"))
+    currency: Currency = Field(description=_DESC("Account currency"))
+    buying_power: JsonDecimal = Field(description=_DESC("Buying power"))
+    cash: JsonDecimal = Field(description=_DESC("Cash balance"))
+    market_value: JsonDecimal = Field(description=_DESC("Market value"))
+    net_liquidation: JsonDecimal = Field(description=_DESC("Net liquidation value"))
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class OptionContract(BaseModel):
     """Option contract information"""
     
-    symbol: str = Field(description="Option symbol")
-    underlying_symbol: str = Field(description="Underlying symbol")
-    strike: Decimal = Field(description="Strike price")
-    expiry: datetime = Field(description="Expiry date")
-    option_type: OptionType = Field(description="Option type (call/put)")
-    multiplier: int = Field(default=100, description="Contract multiplier")
+    symbol: str = Field(description=_DESC("Option symbol"))
+    underlying_symbol: str = Field(description=_DESC("Underlying symbol"))
+    strike: JsonDecimal = Field(description=_DESC("Strike price"))
+    expiry: JsonDatetime = Field(description=_DESC("Expiry date"))
+    option_type: OptionType = Field(description=_DESC("Option type (call/put)"))
+    multiplier: int = Field(default=100, description=_DESC("Contract multiplier"))
     
     # Market data
-    bid: Optional[Decimal] = Field(default=None, description="Bid price")
-    ask: Optional[Decimal] = Field(default=None, description="Ask price")
-    last: Optional[Decimal] = Field(default=None, description="Last price")
-    volume: Optional[int] = Field(default=None, description="Volume")
-    open_interest: Optional[int] = Field(default=None, description="Open interest")
+    bid: Optional[JsonDecimal] = Field(default=None, description=_DESC("Bid price"))
+    ask: Optional[JsonDecimal] = Field(default=None, description=_DESC("Ask price"))
+    last: Optional[JsonDecimal] = Field(default=None, description=_DESC("Last price"))
+    volume: Optional[int] = Field(default=None, description=_DESC("Volume"))
+    open_interest: Optional[int] = Field(default=None, description=_DESC("Open interest"))
     
     # Greeks
-    delta: Optional[Decimal] = Field(default=None, description="Delta")
-    gamma: Optional[Decimal] = Field(default=None, description="Gamma")
-    theta: Optional[Decimal] = Field(default=None, description="Theta")
-    vega: Optional[Decimal] = Field(default=None, description="Vega")
-    implied_volatility: Optional[Decimal] = Field(default=None, description="Implied volatility")
+    delta: Optional[JsonDecimal] = Field(default=None, description=_DESC("Delta"))
+    gamma: Optional[JsonDecimal] = Field(default=None, description=_DESC("Gamma"))
+    theta: Optional[JsonDecimal] = Field(default=None, description=_DESC("Theta"))
+    vega: Optional[JsonDecimal] = Field(default=None, description=_DESC("Vega"))
+    implied_volatility: Optional[JsonDecimal] = Field(default=None, description=_DESC("Implied volatility"))
     
     @property
     def mid_price(self) -> Optional[Decimal]:
         """Calculate mid price from bid/ask"""
         if self.bid is not None and self.ask is not None:
-            return (self.bid + self.ask) / 2
+            return (self.bid + self.ask) * _D_HALF
         return None
     
     @property
@@ -129,38 +161,58 @@ class OptionContract(BaseModel):
         """Check if this is a put option"""
         return self.option_type == OptionType.PUT
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    @cached_property
+    def expiry_ts(self) -> float:
+        """Expiry as POSIX seconds"""
+        return self.expiry.timestamp()
+    
+    @cached_property
+    def strike_f(self) -> float:
+        """Strike as a float for approximate comparisons"""
+        return float(self.strike)
+    
+    @cached_property
+    def bid_f(self) -> Optional[float]:
+        """Bid as a float for approximate comparisons"""
+        return float(self.bid) if self.bid is not None else None
+    
+    @cached_property
+    def ask_f(self) -> Optional[float]:
+        """Ask as a float for approximate comparisons"""
+        return float(self.ask) if self.ask is not None else None
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class TigerOrder(BaseModel):
     """Tiger order information"""
     
-    order_id: str = Field(description="Order ID")
-    account: str = Field(description="Account number")
-    symbol: str = Field(description="Symbol")
-    order_type: OrderType = Field(description="Order type")
-    side: OrderSide = Field(description="Order side")
-    quantity: Decimal = Field(description="Order quantity")
-    price: Optional[Decimal] = Field(default=None, description="Order price")
-    stop_price: Optional[Decimal] = Field(default=None, description="Stop price")
-    time_in_force: TimeInForce = Field(description="Time in force")
-    status: OrderStatus = Field(description="Order status")
+    order_id: str = Field(description=_DESC("Order ID"))
+    account: str = Field(description=_DESC("Account number"))
+    symbol: str = Field(description=_DESC("Symbol"))
+    order_type: OrderType = Field(description=_DESC("Order type"))
+    side: OrderSide = Field(description=_DESC("Order side"))
+    quantity: JsonDecimal = Field(description=_DESC("Order quantity"))
+    price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Order price"))
+    stop_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Stop price"))
+    time_in_force: TimeInForce = Field(description=_DESC("Time in force"))
+    status: OrderStatus = Field(description=_DESC("Order status"))
     
     # Execution information
-    filled_quantity: Decimal = Field(default=Decimal('0'), description="Filled quantity")
-    avg_fill_price: Optional[Decimal] = Field(default=None, description="Average fill price")
+    filled_quantity: JsonDecimal = Field(default=Decimal('0'), description=_DESC("Filled quantity"))
+    avg_fill_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Average fill price"))
     
     # Timestamps
-    created_at: datetime = Field(description="Order creation time")
-    updated_at: Optional[datetime] = Field(default=None, description="Last update time")
+    created_at: JsonDatetime = Field(description=_DESC("Order creation time"))
+    updated_at: Optional[JsonDatetime] = Field(default=None, description=_DESC("Last update time"))
     
     # Additional information
-    commission: Optional[Decimal] = Field(default=None, description="Commission")
-    currency: Currency = Field(description="Currency")
+    commission: Optional[JsonDecimal] = Field(default=None, description=_DESC("Commission"))
+    currency: Currency = Field(description=_DESC("Currency"))
     
     @property
     def remaining_quantity(self) -> Decimal:
@@ -175,30 +227,30 @@ class TigerOrder(BaseModel):
     @property
     def is_active(self) -> bool:
         """Check if order is active (not filled, cancelled, or rejected)"""
-        return self.status in [OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIAL_FILLED]
+        return self.status in _ACTIVE_ORDER_STATUSES
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class Position(BaseModel):
     """Position information"""
     
-    account: str = Field(description="Account number")
-    symbol: str = Field(description="Symbol")
-    quantity: Decimal = Field(description="Position quantity")
-    avg_cost: Decimal = Field(description="Average cost")
-    market_price: Optional[Decimal] = Field(default=None, description="Current market price")
-    market_value: Optional[Decimal] = Field(default=None, description="Current market value")
-    unrealized_pnl: Optional[Decimal] = Field(default=None, description="Unrealized P&L")
-    realized_pnl: Optional[Decimal] = Field(default=None, description="Realized P&L")
+    account: str = Field(description=_DESC("Account number"))
+    symbol: str = Field(description=_DESC("Symbol"))
+    quantity: JsonDecimal = Field(description=_DESC("Position quantity"))
+    avg_cost: JsonDecimal = Field(description=_DESC("Average cost"))
+    market_price: Optional[JsonDecimal] = Field(default=None, description=_DESC("Current market price"))
+    market_value: Optional[JsonDecimal] = Field(default=None, description=_DESC("Current market value"))
+    unrealized_pnl: Optional[JsonDecimal] = Field(default=None, description=_DESC("Unrealized P&L"))
+    realized_pnl: Optional[JsonDecimal] = Field(default=None, description=_DESC("Realized P&L"))
     
     # Position metadata
-    currency: Currency = Field(description="Currency")
-    multiplier: int = Field(default=1, description="Contract multiplier")
+    currency: Currency = Field(description=_DESC("Currency"))
+    multiplier: int = Field(default=1, description=_DESC("Contract multiplier"))
     
     @property
     def is_long(self) -> bool:
@@ -220,41 +272,48 @@ class Position(BaseModel):
         """Calculate notional value"""
         return abs(self.quantity) * self.avg_cost * self.multiplier
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
 
 
 class TradingSignal(BaseModel):
     """Processed trading signal"""
     
-    # Original webhook data
-    webhook_payload: Dict[str, Any] = Field(description="Original webhook payload")
+    # Original webhook data, kept as the raw JSON body and decoded on demand
+    webhook_payload_raw: bytes = Field(description=_DESC("Original webhook payload (raw JSON)"))
     
     # Processed signal information
-    account_name: str = Field(description="Account name")
-    symbol: str = Field(description="Underlying symbol")
-    action: Literal["open", "close", "reverse"] = Field(description="Trading action")
-    side: OrderSide = Field(description="Order side")
-    quantity: Decimal = Field(description="Order quantity")
+    account_name: str = Field(description=_DESC("Account name"))
+    symbol: str = Field(description=_DESC("Underlying symbol"))
+    action: SignalAction = Field(description=_DESC("Trading action"))
+    side: OrderSide = Field(description=_DESC("Order side"))
+    quantity: JsonDecimal = Field(description=_DESC("Order quantity"))
     
     # Option selection criteria
-    option_type: Optional[OptionType] = Field(default=None, description="Option type")
-    strike_selection: Optional[str] = Field(default=None, description="Strike selection method")
-    expiry_selection: Optional[str] = Field(default=None, description="Expiry selection method")
+    option_type: Optional[OptionType] = Field(default=None, description=_DESC("Option type"))
+    strike_selection: Optional[str] = Field(default=None, description=_DESC("Strike selection method"))
+    expiry_selection: Optional[str] = Field(default=None, description=_DESC("Expiry selection method"))
     
     # Risk management
-    max_loss: Optional[Decimal] = Field(default=None, description="Maximum loss")
-    max_position_size: Optional[Decimal] = Field(default=None, description="Maximum position size")
+    max_loss: Optional[JsonDecimal] = Field(default=None, description=_DESC("Maximum loss"))
+    max_position_size: Optional[JsonDecimal] = Field(default=None, description=_DESC("Maximum position size"))
     
     # Metadata
-    signal_id: str = Field(description="Unique signal ID")
-    received_at: datetime = Field(default_factory=datetime.utcnow, description="Signal received time")
-    processed_at: Optional[datetime] = Field(default=None, description="Signal processed time")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat()
-        }
+    signal_id: str = Field(description=_DESC("Unique signal ID"))
+    received_at: JsonDatetime = Field(default_factory=datetime.utcnow, description=_DESC("Signal received time"))
+    processed_at: Optional[JsonDatetime] = Field(default=None, description=_DESC("Signal processed time"))
+    
+    @cached_property
+    def webhook_payload(self) -> Dict[str, Any]:
+        """Get original webhook payload as a dict"""
+        return json.loads(self.webhook_payload_raw)
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        populate_by_name=True,
+    )
+        
\ No newline at end of file
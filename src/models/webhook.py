@@ -2,168 +2,231 @@
 Webhook data models for TradingView signals
 """
 
-from datetime import datetime
-from typing import Optional, Literal, Dict, Any, List
+import re
+import time
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from typing import Optional, Dict, Any, List, Union
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializationInfo,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+from .common import JsonDecimal
+
+
+# Plain decimal/exponent numbers, the shape TradingView sends; anything else
+# falls back to a full Decimal parse
+_NUMERIC_RE = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+
+# Allowed values for the enumerated payload fields
+_SIDES = frozenset({"buy", "sell"})
+_MARKET_POSITIONS = frozenset({"long", "short", "flat"})
+_QTY_TYPES = frozenset({"fixed", "cash"})
+_ACTIONS = frozenset({"buy", "sell", "close", "close_all"})
+_ORDER_TYPES = frozenset({"market", "limit", "stop", "stop_limit"})
+_PAYLOAD_CHOICES = {
+    "side": _SIDES,
+    "market_position": _MARKET_POSITIONS,
+    "prev_market_position": _MARKET_POSITIONS,
+    "qty_type": _QTY_TYPES,
+}
+
+# Position transitions encoded as (prev << 2) | current
+_POS_IDX = {"flat": 0, "long": 1, "short": 2}
+_OPENING_TRANSITIONS = frozenset({(0 << 2) | 1, (0 << 2) | 2})
+_CLOSING_TRANSITIONS = frozenset({(1 << 2) | 0, (2 << 2) | 0})
+_REVERSING_TRANSITIONS = frozenset({(1 << 2) | 2, (2 << 2) | 1})
+
+# UTC timestamps of the form 2024-01-01T00:00:00Z
+_ISO_UTC_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}Z")
+
+
+def _check_choice(field: str, value: str, allowed: frozenset) -> None:
+    """Raise if value is not one of the allowed choices"""
+    if value not in allowed:
+        raise ValueError(f"Invalid {field}: {value}. Must be one of: {sorted(allowed)}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(v: str) -> datetime:
+    """Parse a Unix or ISO format timestamp string"""
+    if v.isdigit():
+        return datetime.fromtimestamp(int(v))
+    if len(v) == 20 and _ISO_UTC_RE.fullmatch(v):
+        return datetime(
+            int(v[0:4]), int(v[5:7]), int(v[8:10]),
+            int(v[11:13]), int(v[14:16]), int(v[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(v.replace('Z', '+00:00'))
 
 
 class WebhookSignalPayload(BaseModel):
     """TradingView webhook signal payload"""
     
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="forbid")
+    
     # Account and trading information
-    account_name: str = Field(
-        alias="accountName",
-        description="Account name, corresponds to the name in apikeys configuration"
-    )
-    side: Literal["buy", "sell"] = Field(description="Trading direction: buy/sell")
-    exchange: str = Field(description="Exchange name")
-    period: str = Field(description="K-line period")
+    account_name: str = Field(validation_alias="accountName")  # apikeys account name
+    side: str = Field(json_schema_extra={"enum": sorted(_SIDES)})  # buy/sell
+    exchange: str
+    period: str  # K-line period
     
     # Market position information
-    market_position: Literal["long", "short", "flat"] = Field(
-        alias="marketPosition",
-        description="Current market position"
+    market_position: str = Field(
+        validation_alias="marketPosition",
+        json_schema_extra={"enum": sorted(_MARKET_POSITIONS)},
     )
-    prev_market_position: Literal["long", "short", "flat"] = Field(
-        alias="prevMarketPosition", 
-        description="Previous market position"
+    prev_market_position: str = Field(
+        validation_alias="prevMarketPosition",
+        json_schema_extra={"enum": sorted(_MARKET_POSITIONS)},
     )
     
     # Trading details
-    symbol: str = Field(description="Trading pair symbol")
-    price: str = Field(description="Current price")
-    timestamp: str = Field(description="Timestamp")
-    size: str = Field(description="Order quantity/contracts")
-    position_size: str = Field(
-        alias="positionSize",
-        description="Current position size"
-    )
+    symbol: str
+    price: str
+    timestamp: str
+    size: str  # order quantity/contracts
+    position_size: str = Field(validation_alias="positionSize")
     
     # Order identification
-    id: str = Field(description="Strategy order ID")
-    alert_message: Optional[str] = Field(
-        default=None,
-        alias="alertMessage",
-        description="Alert message"
-    )
-    comment: Optional[str] = Field(default=None, description="Comment")
+    id: str  # strategy order ID
+    alert_message: Optional[str] = Field(default=None, validation_alias="alertMessage")
+    comment: Optional[str] = None
     
     # Quantity type
-    qty_type: Literal["fixed", "cash"] = Field(
-        alias="qtyType",
-        description="Quantity type"
+    qty_type: str = Field(
+        validation_alias="qtyType",
+        json_schema_extra={"enum": sorted(_QTY_TYPES)},
     )
 
     # TradingView specific fields
-    tv_id: Optional[int] = Field(default=None, description="TradingView signal ID")
+    tv_id: Optional[int] = None
 
     # Optional delta fields for options trading
-    delta1: Optional[float] = Field(default=None, description="Option Delta value for opening positions")
-    n: Optional[int] = Field(default=None, description="Minimum expiry days for option selection")
-    delta2: Optional[float] = Field(default=None, description="Target Delta value for recording to delta database")
+    delta1: Optional[float] = None  # option delta for opening positions
+    n: Optional[int] = None  # minimum expiry days for option selection
+    delta2: Optional[float] = None  # target delta recorded to the delta database
+    
+    _transition: int = PrivateAttr(default=0)
     
-    @validator('price', 'size', 'position_size')
-    def validate_numeric_strings(cls, v):
+    @field_validator('price', 'size', 'position_size', mode="after")
+    @classmethod
+    def validate_numeric_strings(cls, v: str) -> str:
         """Validate that numeric strings can be converted to Decimal"""
+        if _NUMERIC_RE.fullmatch(v):
+            return v
         try:
             Decimal(v)
             return v
         except Exception:
             raise ValueError(f"Invalid numeric value: {v}")
     
-    @validator('timestamp')
-    def validate_timestamp(cls, v):
+    @field_validator('side', 'market_position', 'prev_market_position', 'qty_type', mode="after")
+    @classmethod
+    def validate_choices(cls, v: str, info: ValidationInfo) -> str:
+        """Validate enumerated string fields"""
+        _check_choice(info.field_name, v, _PAYLOAD_CHOICES[info.field_name])
+        return v
+    
+    @model_validator(mode="after")
+    def _compute_transition(self) -> "WebhookSignalPayload":
+        """Encode the position transition once the fields are validated"""
+        self._transition = (_POS_IDX[self.prev_market_position] << 2) | _POS_IDX[self.market_position]
+        return self
+    
+    @field_validator('timestamp', mode="after")
+    @classmethod
+    def validate_timestamp(cls, v: str) -> str:
         """Validate timestamp format"""
         try:
             # Try to parse as ISO format or Unix timestamp
-            if v.isdigit():
-                datetime.fromtimestamp(int(v))
-            else:
-                datetime.fromisoformat(v.replace('Z', '+00:00'))
+            _parse_timestamp(v)
             return v
         except Exception:
             raise ValueError(f"Invalid timestamp format: {v}")
     
-    @property
+    @cached_property
     def price_decimal(self) -> Decimal:
         """Get price as Decimal"""
         return Decimal(self.price)
     
-    @property
+    @cached_property
     def size_decimal(self) -> Decimal:
         """Get size as Decimal"""
         return Decimal(self.size)
     
-    @property
+    @cached_property
     def position_size_decimal(self) -> Decimal:
         """Get position size as Decimal"""
         return Decimal(self.position_size)
     
-    @property
+    @cached_property
     def timestamp_datetime(self) -> datetime:
         """Get timestamp as datetime"""
-        if self.timestamp.isdigit():
-            return datetime.fromtimestamp(int(self.timestamp))
-        else:
-            return datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
+        return _parse_timestamp(self.timestamp)
     
     @property
     def is_opening_position(self) -> bool:
         """Check if this signal is opening a new position"""
-        return self.prev_market_position == "flat" and self.market_position != "flat"
+        return self._transition in _OPENING_TRANSITIONS
     
     @property
     def is_closing_position(self) -> bool:
         """Check if this signal is closing a position"""
-        return self.prev_market_position != "flat" and self.market_position == "flat"
+        return self._transition in _CLOSING_TRANSITIONS
     
     @property
     def is_reversing_position(self) -> bool:
         """Check if this signal is reversing position"""
-        return (
-            self.prev_market_position != "flat" and 
-            self.market_position != "flat" and 
-            self.prev_market_position != self.market_position
-        )
+        return self._transition in _REVERSING_TRANSITIONS
 
 
 class WebhookResponse(BaseModel):
     """Webhook response format"""
     
-    success: bool = Field(description="Whether the operation was successful")
-    message: str = Field(description="Response message")
+    success: bool
+    message: str
     
     # Optional data for successful operations
-    data: Optional[dict] = Field(default=None, description="Response data")
+    data: Optional[dict] = None
     
     # Optional error information
-    error: Optional[str] = Field(default=None, description="Error message")
+    error: Optional[str] = None
     
     # Metadata
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
-    request_id: Optional[str] = Field(default=None, description="Request ID for tracking")
+    timestamp: float = Field(default_factory=time.time)  # Unix time, serialized as UTC ISO
+    request_id: Optional[str] = None  # for request tracking
+    
+    model_config = ConfigDict(frozen=True)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @field_serializer('timestamp')
+    def serialize_timestamp(self, v: float, info: SerializationInfo) -> Union[datetime, str]:
+        """Dump the Unix timestamp as a naive UTC datetime, or its ISO string in JSON mode"""
+        dt = datetime.fromtimestamp(v, timezone.utc).replace(tzinfo=None)
+        return dt.isoformat() if info.mode_is_json() else dt
 
 
 class WebhookOrderData(BaseModel):
     """Order data included in successful webhook responses"""
     
-    order_id: Optional[str] = Field(default=None, description="Order ID")
-    instrument_name: Optional[str] = Field(default=None, description="Instrument name")
-    executed_quantity: Optional[Decimal] = Field(default=None, description="Executed quantity")
-    executed_price: Optional[Decimal] = Field(default=None, description="Executed price")
-    order_status: Optional[str] = Field(default=None, description="Order status")
+    order_id: Optional[str] = None
+    instrument_name: Optional[str] = None
+    executed_quantity: Optional[JsonDecimal] = None
+    executed_price: Optional[JsonDecimal] = None
+    order_status: Optional[str] = None
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 # Additional models for simplified webhook interface
@@ -171,39 +234,45 @@ class WebhookOrderData(BaseModel):
 class WebhookSignal(BaseModel):
     """Simplified webhook signal model for general use"""
 
-    signal_id: Optional[str] = Field(default=None, description="Signal ID")
-    symbol: str = Field(description="Trading symbol")
-    action: str = Field(description="Trading action: buy, sell, close, close_all")
-    quantity: Optional[Decimal] = Field(default=None, description="Order quantity")
-    price: Optional[Decimal] = Field(default=None, description="Order price")
-    stop_price: Optional[Decimal] = Field(default=None, description="Stop price")
-    order_type: Optional[str] = Field(default="market", description="Order type")
-    time_in_force: Optional[str] = Field(default="day", description="Time in force")
-    strategy: Optional[str] = Field(default=None, description="Strategy name")
-    comment: Optional[str] = Field(default=None, description="Comment")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
-
-    @validator('action')
-    def validate_action(cls, v):
+    model_config = ConfigDict(frozen=True)
+
+    signal_id: Optional[str] = None
+    symbol: str
+    action: str  # buy, sell, close, close_all
+    quantity: Optional[Decimal] = None
+    price: Optional[Decimal] = None
+    stop_price: Optional[Decimal] = None
+    order_type: Optional[str] = "market"  # market, limit, stop, stop_limit
+    time_in_force: Optional[str] = "day"
+    strategy: Optional[str] = None
+    comment: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+
+    @field_validator('action', mode="after")
+    @classmethod
+    def validate_action(cls, v: str) -> str:
         """Validate action field"""
-        valid_actions = ["buy", "sell", "close", "close_all"]
-        if v.lower() not in valid_actions:
-            raise ValueError(f"Invalid action: {v}. Must be one of: {valid_actions}")
-        return v.lower()
+        action = v.lower()
+        if action not in _ACTIONS:
+            raise ValueError(f"Invalid action: {v}. Must be one of: {sorted(_ACTIONS)}")
+        return action
 
-    @validator('order_type')
-    def validate_order_type(cls, v):
+    @field_validator('order_type', mode="after")
+    @classmethod
+    def validate_order_type(cls, v: Optional[str]) -> str:
         """Validate order type field"""
         if v is None:
             return "market"
-        valid_types = ["market", "limit", "stop", "stop_limit"]
-        if v.lower() not in valid_types:
-            raise ValueError(f"Invalid order type: {v}. Must be one of: {valid_types}")
-        return v.lower()
+        order_type = v.lower()
+        if order_type not in _ORDER_TYPES:
+            raise ValueError(f"Invalid order type: {v}. Must be one of: {sorted(_ORDER_TYPES)}")
+        return order_type
 
 
 class TradeSignal(BaseModel):
     """Internal trade signal after processing webhook"""
+    model_config = ConfigDict(frozen=True)
+
     signal_id: str
     account_name: str
     symbol: str
@@ -222,6 +291,8 @@ class TradeSignal(BaseModel):
 
 class SignalValidationResult(BaseModel):
     """Result of signal validation"""
+    model_config = ConfigDict(frozen=True)
+
     is_valid: bool
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
@@ -2,43 +2,94 @@
 Services layer package for Tiger Options Trading Service
 """
 
-# Tiger API clients
-from .tiger_client import TigerClient, TigerClientError
-from .mock_tiger_client import MockTigerClient
-from .tiger_client_factory import (
-    TigerClientFactory,
-    TigerClientType,
-    create_tiger_client,
-    get_tiger_client,
-    get_tiger_client_by_name,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Authentication service
-from .auth_service import (
-    AuthService,
-    AuthenticationError,
-    get_auth_service,
-    initialize_auth_service,
-)
+# Exported names are resolved on first access (PEP 562) so importing one
+# service does not pull in the whole package and the Tiger SDK with it
+_LAZY = {
+    # Tiger API clients
+    "TigerClient": ".tiger_client",
+    "TigerClientError": ".tiger_client",
+    "MockTigerClient": ".mock_tiger_client",
+    "TigerClientFactory": ".tiger_client_factory",
+    "TigerClientType": ".tiger_client_factory",
+    "create_tiger_client": ".tiger_client_factory",
+    "get_tiger_client": ".tiger_client_factory",
+    "get_tiger_client_by_name": ".tiger_client_factory",
 
-# Signal validation and processing
-from .signal_validator import (
-    SignalValidator,
-    SignalValidationError,
-    get_signal_validator,
-)
-from .signal_processor import (
-    SignalProcessor,
-    SignalProcessingError,
-    get_signal_processor,
-)
+    # Authentication service
+    "AuthService": ".auth_service",
+    "AuthenticationError": ".auth_service",
+    "get_auth_service": ".auth_service",
+    "initialize_auth_service": ".auth_service",
+
+    # Signal validation and processing
+    "SignalValidator": ".signal_validator",
+    "SignalValidationError": ".signal_validator",
+    "get_signal_validator": ".signal_validator",
+    "SignalProcessor": ".signal_processor",
+    "SignalProcessingError": ".signal_processor",
+    "get_signal_processor": ".signal_processor",
+
+    # Enhanced trading services
+    "EnhancedSignalProcessor": ".enhanced_signal_processor",
+    "OptionSelector": ".option_selector",
+    "SelectionStrategy": ".option_selector",
+    "OrderStrategyService": ".order_strategy",
+    "OrderStrategy": ".order_strategy",
+    "OrderParams": ".order_strategy",
+    "PositionManager": ".position_manager",
+    "RiskManager": ".risk_manager",
+    "RiskCheckResult": ".risk_manager",
+}
+
+if TYPE_CHECKING:
+    from .tiger_client import TigerClient, TigerClientError
+    from .mock_tiger_client import MockTigerClient
+    from .tiger_client_factory import (
+        TigerClientFactory,
+        TigerClientType,
+        create_tiger_client,
+        get_tiger_client,
+        get_tiger_client_by_name,
+    )
+    from .auth_service import (
+        AuthService,
+        AuthenticationError,
+        get_auth_service,
+        initialize_auth_service,
+    )
+    from .signal_validator import (
+        SignalValidator,
+        SignalValidationError,
+        get_signal_validator,
+    )
+    from .signal_processor import (
+        SignalProcessor,
+        SignalProcessingError,
+        get_signal_processor,
+    )
+    from .enhanced_signal_processor import EnhancedSignalProcessor
+    from .option_selector import OptionSelector, SelectionStrategy
+    from .order_strategy import OrderStrategyService, OrderStrategy, OrderParams
+    from .position_manager import PositionManager
+    from .risk_manager import RiskManager, RiskCheckResult
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
 
-# Enhanced trading services
-from .enhanced_signal_processor import EnhancedSignalProcessor
-from .option_selector import OptionSelector, SelectionStrategy
-from .order_strategy import OrderStrategyService, OrderStrategy
-from .position_manager import PositionManager
-from .risk_manager import RiskManager, RiskCheckResult
 
 __all__ = [
     # Tiger clients
@@ -71,6 +122,7 @@ __all__ = [
     "SelectionStrategy",
     "OrderStrategyService",
     "OrderStrategy",
+    "OrderParams",
     "PositionManager",
     "RiskManager",
     "RiskCheckResult",
@@ -3,11 +3,13 @@ Authentication service for Tiger Brokers API
 """
 
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import os
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 
 from ..config import AccountConfig, ApiKeysConfig, load_api_keys_config
+from ..config.settings import get_config_dir
 from ..models import ConfigValidationResult
 from .tiger_client_factory import TigerClientFactory, TigerClientType
 
@@ -15,6 +17,29 @@ from .tiger_client_factory import TigerClientFactory, TigerClientType
 logger = logging.getLogger(__name__)
 
 
+# AccountConfig.is_private_key_valid results keyed on (path, mtime), so a
+# rotated key file is re-checked automatically
+_private_key_checks: Dict[Tuple[str, float], bool] = {}
+_MAX_PRIVATE_KEY_CHECKS = 64
+
+
+def _is_private_key_valid(account: AccountConfig) -> bool:
+    """Check an account's private key file with a single stat on the hot path"""
+    path = os.path.expanduser(account.private_key_path)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return False
+    
+    key = (path, mtime)
+    valid = _private_key_checks.get(key)
+    if valid is None:
+        if len(_private_key_checks) >= _MAX_PRIVATE_KEY_CHECKS:
+            _private_key_checks.clear()
+        valid = _private_key_checks[key] = account.is_private_key_valid()
+    return valid
+
+
 class AuthenticationError(Exception):
     """Authentication related error"""
     pass
@@ -27,8 +52,14 @@ class AuthService:
         """Initialize authentication service"""
         self._api_keys_config: Optional[ApiKeysConfig] = None
         self._account_configs: Dict[str, AccountConfig] = {}
+        self._enabled_configs: Dict[str, AccountConfig] = {}
         self._connection_status: Dict[str, bool] = {}
+        self._clients: Optional[Mapping[str, TigerClientType]] = None
+        self._account_configs_view: Mapping[str, AccountConfig] = MappingProxyType(self._account_configs)
+        self._connection_status_view: Mapping[str, bool] = MappingProxyType(self._connection_status)
         self._last_validation: Optional[datetime] = None
+        self._last_result: Optional[ConfigValidationResult] = None
+        self._config_key: Optional[Tuple] = None
         
         logger.info("Authentication service initialized")
     
@@ -43,9 +74,23 @@ class AuthService:
                 account.name: account 
                 for account in self._api_keys_config.accounts
             }
+            self._account_configs_view = MappingProxyType(self._account_configs)
+            self._clients = None
+            self._enabled_configs = {
+                name: config
+                for name, config in self._account_configs.items()
+                if config.enabled
+            }
             
-            # Validate configuration
-            validation_result = self._validate_configuration()
+            # Validate configuration, reusing the last result while neither
+            # the config file nor any private key file has changed
+            config_key = self._config_file_key(config_file)
+            if config_key is not None and config_key == self._config_key and self._last_result is not None:
+                validation_result = self._last_result
+            else:
+                validation_result = self._validate_configuration()
+                self._last_result = validation_result
+                self._config_key = config_key
             self._last_validation = datetime.now()
             
             logger.info(f"Configuration loaded: {len(self._account_configs)} accounts")
@@ -55,6 +100,28 @@ class AuthService:
             logger.error(f"Failed to load configuration: {e}")
             raise AuthenticationError(f"Configuration loading failed: {e}")
     
+    def _config_file_key(self, config_file: Optional[str]) -> Optional[Tuple]:
+        """
+        Get the (path, mtime) of the API keys config file plus the mtimes of
+        the private key files it references, or None if the config file
+        can't be read
+        """
+        path = config_file or str(get_config_dir() / "apikeys.yml")
+        try:
+            config_mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        
+        key_mtimes = []
+        for account in self._api_keys_config.accounts:
+            key_path = os.path.expanduser(account.private_key_path)
+            try:
+                key_mtimes.append((key_path, os.stat(key_path).st_mtime))
+            except OSError:
+                key_mtimes.append((key_path, None))
+        
+        return path, config_mtime, tuple(key_mtimes)
+    
     def _validate_configuration(self) -> ConfigValidationResult:
         """Validate the loaded configuration"""
         errors = []
@@ -114,7 +181,7 @@ class AuthService:
         
         # Check private key file
         if account.private_key_path:
-            if not account.is_private_key_valid():
+            if not _is_private_key_valid(account):
                 errors.append(f"Private key file not found or not readable: {account.private_key_path}")
         
         # Validate settings
@@ -129,20 +196,15 @@ class AuthService:
     
     def get_enabled_account_config(self, account_name: str) -> Optional[AccountConfig]:
         """Get enabled account configuration by name"""
-        account = self.get_account_config(account_name)
-        return account if account and account.enabled else None
+        return self._enabled_configs.get(account_name)
     
-    def get_all_account_configs(self) -> Dict[str, AccountConfig]:
-        """Get all account configurations"""
-        return self._account_configs.copy()
+    def get_all_account_configs(self) -> Mapping[str, AccountConfig]:
+        """Get a read-only view of all account configurations"""
+        return self._account_configs_view
     
     def get_enabled_account_configs(self) -> Dict[str, AccountConfig]:
-        """Get all enabled account configurations"""
-        return {
-            name: config 
-            for name, config in self._account_configs.items() 
-            if config.enabled
-        }
+        """Get all enabled account configurations (shared, do not mutate)"""
+        return self._enabled_configs
     
     def get_account_names(self) -> List[str]:
         """Get list of all account names"""
@@ -150,10 +212,7 @@ class AuthService:
     
     def get_enabled_account_names(self) -> List[str]:
         """Get list of enabled account names"""
-        return [
-            name for name, config in self._account_configs.items() 
-            if config.enabled
-        ]
+        return list(self._enabled_configs)
     
     def test_connection(self, account_name: str) -> bool:
         """Test connection for a specific account"""
@@ -193,9 +252,9 @@ class AuthService:
         """Get cached connection status for an account"""
         return self._connection_status.get(account_name)
     
-    def get_all_connection_status(self) -> Dict[str, bool]:
-        """Get cached connection status for all accounts"""
-        return self._connection_status.copy()
+    def get_all_connection_status(self) -> Mapping[str, bool]:
+        """Get a read-only view of cached connection status for all accounts"""
+        return self._connection_status_view
     
     def get_client(self, account_name: str) -> Optional[TigerClientType]:
         """Get Tiger client for an account"""
@@ -205,25 +264,31 @@ class AuthService:
         
         return TigerClientFactory.get_client(account_config)
     
-    def get_all_clients(self) -> Dict[str, TigerClientType]:
-        """Get Tiger clients for all enabled accounts"""
-        clients = {}
-        enabled_configs = self.get_enabled_account_configs()
+    def get_all_clients(self) -> Mapping[str, TigerClientType]:
+        """Get a read-only view of Tiger clients for all enabled accounts"""
+        if self._clients is not None:
+            return self._clients
         
-        for account_name, account_config in enabled_configs.items():
+        clients = {}
+        for account_name, account_config in self._enabled_configs.items():
             try:
-                client = TigerClientFactory.get_client(account_config)
-                clients[account_name] = client
+                clients[account_name] = TigerClientFactory.get_client(account_config)
             except Exception as e:
                 logger.error(f"Failed to get client for account {account_name}: {e}")
         
-        return clients
+        view = MappingProxyType(clients)
+        # Only cache a complete set so failed accounts are retried next call
+        if len(clients) == len(self._enabled_configs):
+            self._clients = view
+        return view
     
     def reload_configuration(self, config_file: Optional[str] = None) -> ConfigValidationResult:
         """Reload configuration and clear client cache"""
         # Clear client cache
         TigerClientFactory.clear_cache()
         self._connection_status.clear()
+        self._enabled_configs = {}
+        self._clients = None
         
         # Reload configuration
         return self.load_configuration(config_file)
@@ -235,12 +300,12 @@ class AuthService:
             return False
         
         # Check if private key is valid
-        return account_config.is_private_key_valid()
+        return _is_private_key_valid(account_config)
     
     def get_account_summary(self) -> Dict[str, any]:
         """Get summary of all accounts"""
         total_accounts = len(self._account_configs)
-        enabled_accounts = len(self.get_enabled_account_configs())
+        enabled_accounts = len(self._enabled_configs)
         
         # Count accounts by status
         connected_accounts = sum(1 for status in self._connection_status.values() if status)
@@ -5,10 +5,14 @@ This module processes webhook signals through the complete trading pipeline:
 validation -> option selection -> order strategy -> risk management -> execution
 """
 
+import asyncio
 import logging
+import time
 import uuid
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
+from typing import Deque, Dict, Any, Optional, List, Tuple
 from decimal import Decimal
 
 from ..models import (
@@ -18,7 +22,7 @@ from ..models import (
     OptionContract,
     OrderSide
 )
-from ..config import AccountConfig
+from ..config import AccountConfig, get_settings
 from .signal_validator import get_signal_validator
 from .auth_service import get_auth_service
 from .option_selector import OptionSelector, SelectionStrategy
@@ -29,6 +33,119 @@ from .risk_manager import RiskManager, RiskCheckResult
 
 logger = logging.getLogger(__name__)
 
+# Mock underlying price used when a signal carries none
+_DEFAULT_PRICE = Decimal('150.00')
+
+# Pipeline strategies
+_SELECTION_STRATEGY = SelectionStrategy.ATM
+_ORDER_STRATEGY = OrderStrategy.LIMIT_MIDPOINT
+
+# Most recent processed signals kept for status lookups
+_MAX_PROCESSED_SIGNALS = 10_000
+
+# Queue length above which enqueueing logs an overload warning
+_QUEUE_SOFT_LIMIT = 1_000
+
+# Option chains are reused for this many seconds per symbol
+_CHAIN_TTL_SECONDS = 5.0
+
+# Static values for the mock option chain
+_MOCK_STRIKES = (140, 145, 150, 155, 160)
+_MOCK_CALL_SUFFIXES = tuple((strike, f"250117C{strike:08.0f}000") for strike in _MOCK_STRIKES)
+_MOCK_PUT_SUFFIXES = tuple((strike, f"250117P{strike:08.0f}000") for strike in _MOCK_STRIKES)
+_MOCK_EXPIRY = datetime(2025, 1, 17)
+_MOCK_CALL_BID = Decimal('2.50')
+_MOCK_CALL_ASK = Decimal('2.70')
+_MOCK_CALL_LAST = Decimal('2.60')
+_MOCK_PUT_BID = Decimal('1.80')
+_MOCK_PUT_ASK = Decimal('2.00')
+_MOCK_PUT_LAST = Decimal('1.90')
+
+
+@lru_cache(maxsize=128)
+def _build_mock_chain(symbol: str) -> Tuple[OptionContract, ...]:
+    """Build the static mock option chain for a symbol"""
+    
+    # Generate mock call options
+    mock_contracts = [
+        OptionContract(
+            symbol=f"{symbol}  {suffix}",
+            underlying_symbol=symbol,
+            strike=Decimal(strike),
+            expiry=_MOCK_EXPIRY,
+            option_type="call",
+            bid=_MOCK_CALL_BID,
+            ask=_MOCK_CALL_ASK,
+            last=_MOCK_CALL_LAST,
+            volume=100,
+            open_interest=500
+        )
+        for strike, suffix in _MOCK_CALL_SUFFIXES
+    ]
+    
+    # Generate mock put options
+    mock_contracts.extend(
+        OptionContract(
+            symbol=f"{symbol}  {suffix}",
+            underlying_symbol=symbol,
+            strike=Decimal(strike),
+            expiry=_MOCK_EXPIRY,
+            option_type="put",
+            bid=_MOCK_PUT_BID,
+            ask=_MOCK_PUT_ASK,
+            last=_MOCK_PUT_LAST,
+            volume=80,
+            open_interest=300
+        )
+        for strike, suffix in _MOCK_PUT_SUFFIXES
+    )
+    
+    return tuple(mock_contracts)
+
+
+class QueuedSignal:
+    """A processed signal waiting in, or drained from, the execution queue"""
+    
+    __slots__ = (
+        "signal_id",
+        "account_name",
+        "webhook_signal",
+        "trade_signal",
+        "validation_result",
+        "processing_result",
+        "status",
+        "queued_at",
+        "processed_at",
+        "order_id",
+        "error",
+    )
+    
+    def __init__(
+        self,
+        signal_id: str,
+        account_name: str,
+        webhook_signal: WebhookSignal,
+        trade_signal: TradeSignal,
+        validation_result: SignalValidationResult,
+        processing_result: Dict[str, Any],
+        status: str,
+        queued_at: str,
+        processed_at: Optional[str] = None,
+        order_id: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        self.signal_id = signal_id
+        self.account_name = account_name
+        self.webhook_signal = webhook_signal
+        self.trade_signal = trade_signal
+        self.validation_result = validation_result
+        self.processing_result = processing_result
+        self.status = status
+        self.queued_at = queued_at
+        self.processed_at = processed_at
+        self.order_id = order_id
+        self.error = error
+
 
 class EnhancedSignalProcessor:
     """
@@ -38,41 +155,53 @@ class EnhancedSignalProcessor:
     validation -> option selection -> order strategy -> risk management -> execution
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None):
         """Initialize enhanced signal processor"""
+        self.max_concurrency = max_concurrency or get_settings().signal_concurrency
+        self._execution_semaphore: Optional[asyncio.Semaphore] = None
         self.validator = get_signal_validator()
         self.auth_service = get_auth_service()
-        self.signal_queue: List[Dict[str, Any]] = []
-        self.processed_signals: Dict[str, Dict[str, Any]] = {}
+        self.signal_queue: Deque[QueuedSignal] = deque()
+        self._status_counts: Counter = Counter()  # statuses of signals currently queued
+        self.processed_signals: "OrderedDict[str, QueuedSignal]" = OrderedDict()
+        self._max_processed = _MAX_PROCESSED_SIGNALS
         
         # Account-specific services (initialized per account)
         self._account_services: Dict[str, Dict[str, Any]] = {}
         
+        # Option chain cache: symbol -> (fetched_at, contracts), plus in-flight fetches
+        self._chain_cache: Dict[str, Tuple[float, List[OptionContract]]] = {}
+        self._chain_inflight: Dict[str, asyncio.Future] = {}
+        
         logger.info("Enhanced signal processor initialized")
     
     def _get_account_services(self, account_name: str) -> Optional[Dict[str, Any]]:
         """Get or create account-specific services"""
         
-        if account_name not in self._account_services:
-            account_config = self.auth_service.get_account_config(account_name)
-            if not account_config:
-                return None
-            
-            # Initialize account-specific services
-            position_manager = PositionManager(account_config)
-            risk_manager = RiskManager(account_config, position_manager)
-            option_selector = OptionSelector(account_config)
-            order_strategy = OrderStrategyService(account_config)
-            
-            self._account_services[account_name] = {
-                "config": account_config,
-                "position_manager": position_manager,
-                "risk_manager": risk_manager,
-                "option_selector": option_selector,
-                "order_strategy": order_strategy
-            }
+        services = self._account_services.get(account_name)
+        if services is not None:
+            return services
         
-        return self._account_services[account_name]
+        account_config = self.auth_service.get_account_config(account_name)
+        if not account_config:
+            return None
+        
+        # Initialize account-specific services
+        position_manager = PositionManager(account_config)
+        risk_manager = RiskManager(account_config, position_manager)
+        option_selector = OptionSelector(account_config)
+        order_strategy = OrderStrategyService(account_config)
+        
+        services = {
+            "config": account_config,
+            "position_manager": position_manager,
+            "risk_manager": risk_manager,
+            "option_selector": option_selector,
+            "order_strategy": order_strategy
+        }
+        self._account_services[account_name] = services
+        
+        return services
     
     async def process_signal(
         self, 
@@ -91,7 +220,7 @@ class EnhancedSignalProcessor:
         """
         
         # Generate unique signal ID
-        signal_id = str(uuid.uuid4())
+        signal_id = uuid.uuid4().hex
         
         try:
             # Get account services
@@ -128,20 +257,24 @@ class EnhancedSignalProcessor:
                 trade_signal, services, signal_id
             )
             
-            # Queue for execution
-            queued_signal = {
-                "signal_id": signal_id,
-                "account_name": account_name,
-                "webhook_signal": webhook_signal.dict(),
-                "trade_signal": trade_signal.dict(),
-                "validation_result": validation_result.dict(),
-                "processing_result": processing_result,
-                "status": "queued",
-                "queued_at": datetime.now().isoformat(),
-                "processed_at": None
-            }
+            # Queue for execution; the models are kept as-is and only the
+            # response payload is serialized
+            queued_at = datetime.now().isoformat()
+            queued_signal = QueuedSignal(
+                signal_id=signal_id,
+                account_name=account_name,
+                webhook_signal=webhook_signal,
+                trade_signal=trade_signal,
+                validation_result=validation_result,
+                processing_result=processing_result,
+                status="queued",
+                queued_at=queued_at
+            )
             
             self.signal_queue.append(queued_signal)
+            self._status_counts["queued"] += 1
+            if len(self.signal_queue) > _QUEUE_SOFT_LIMIT:
+                logger.warning(f"Signal queue length {len(self.signal_queue)} exceeds soft limit {_QUEUE_SOFT_LIMIT}")
             
             logger.info(f"Signal queued successfully: {signal_id}")
             
@@ -156,7 +289,7 @@ class EnhancedSignalProcessor:
                 },
                 "validation_result": validation_result.dict(),
                 "processing_result": processing_result,
-                "queued_at": datetime.now().isoformat()
+                "queued_at": queued_at
             }
             
         except Exception as e:
@@ -178,7 +311,7 @@ class EnhancedSignalProcessor:
         
         try:
             # Get current market data (mock for now)
-            current_price = trade_signal.price or Decimal('150.00')
+            current_price = trade_signal.price or _DEFAULT_PRICE
             
             # Step 1: Get option chain
             option_chain = await self._get_option_chain(trade_signal.symbol, services)
@@ -192,7 +325,7 @@ class EnhancedSignalProcessor:
             
             # Step 2: Select option contract
             selected_contract = services["option_selector"].select_option_contract(
-                trade_signal, option_chain, current_price, SelectionStrategy.ATM
+                trade_signal, option_chain, current_price, _SELECTION_STRATEGY
             )
             
             if not selected_contract:
@@ -223,7 +356,7 @@ class EnhancedSignalProcessor:
             
             # Step 5: Create order strategy
             order_params = services["order_strategy"].create_order(
-                trade_signal, selected_contract, OrderStrategy.LIMIT_MIDPOINT, suggested_quantity
+                trade_signal, selected_contract, _ORDER_STRATEGY, suggested_quantity
             )
             
             if not order_params:
@@ -251,7 +384,7 @@ class EnhancedSignalProcessor:
                 "risk_result": risk_result.value,
                 "risk_messages": risk_messages,
                 "risk_metrics": risk_metrics,
-                "order_params": order_params,
+                "order_params": order_params.to_dict(),
                 "pipeline_completed": True
             }
             
@@ -264,47 +397,47 @@ class EnhancedSignalProcessor:
             }
     
     async def _get_option_chain(self, symbol: str, services: Dict[str, Any]) -> List[OptionContract]:
-        """Get option chain for symbol (mock implementation)"""
+        """Get option chain for symbol, cached for a short TTL (shared, do not mutate)"""
+        
+        cached = self._cached_option_chain(symbol)
+        if cached is not None:
+            return cached
+        
+        # Shielded so a cancelled caller does not cancel a fetch others may be awaiting
+        return await asyncio.shield(self._start_option_chain_fetch(symbol, services))
+    
+    def _cached_option_chain(self, symbol: str) -> Optional[List[OptionContract]]:
+        """Get the cached option chain for symbol if it is still fresh"""
+        cached = self._chain_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < _CHAIN_TTL_SECONDS:
+            return cached[1]
+        return None
+    
+    def _start_option_chain_fetch(self, symbol: str, services: Dict[str, Any]) -> asyncio.Future:
+        """Start an option chain fetch, coalescing with one already in flight for symbol"""
+        future = self._chain_inflight.get(symbol)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_and_cache_option_chain(symbol, services))
+            self._chain_inflight[symbol] = future
+        return future
+    
+    async def _fetch_and_cache_option_chain(self, symbol: str, services: Dict[str, Any]) -> List[OptionContract]:
+        """Fetch an option chain and cache non-empty results"""
+        try:
+            contracts = await self._fetch_option_chain(symbol, services)
+            if contracts:
+                self._chain_cache[symbol] = (time.monotonic(), contracts)
+            return contracts
+        finally:
+            self._chain_inflight.pop(symbol, None)
+    
+    async def _fetch_option_chain(self, symbol: str, services: Dict[str, Any]) -> List[OptionContract]:
+        """Fetch option chain for symbol (mock implementation)"""
         
         try:
             # In real implementation, this would call the Tiger API
-            # For now, return mock option contracts
-            
-            mock_contracts = []
-            
-            # Generate mock call options
-            for strike in [140, 145, 150, 155, 160]:
-                contract = OptionContract(
-                    symbol=f"{symbol}  250117C{strike:08.0f}000",
-                    underlying=symbol,
-                    strike=Decimal(str(strike)),
-                    expiry=datetime(2025, 1, 17),
-                    option_type="call",
-                    bid=Decimal('2.50'),
-                    ask=Decimal('2.70'),
-                    last_price=Decimal('2.60'),
-                    volume=100,
-                    open_interest=500
-                )
-                mock_contracts.append(contract)
-            
-            # Generate mock put options
-            for strike in [140, 145, 150, 155, 160]:
-                contract = OptionContract(
-                    symbol=f"{symbol}  250117P{strike:08.0f}000",
-                    underlying=symbol,
-                    strike=Decimal(str(strike)),
-                    expiry=datetime(2025, 1, 17),
-                    option_type="put",
-                    bid=Decimal('1.80'),
-                    ask=Decimal('2.00'),
-                    last_price=Decimal('1.90'),
-                    volume=80,
-                    open_interest=300
-                )
-                mock_contracts.append(contract)
-            
-            return mock_contracts
+            # For now, return the prebuilt mock option contracts
+            return list(_build_mock_chain(symbol))
             
         except Exception as e:
             logger.error(f"Error getting option chain: {e}")
@@ -312,46 +445,27 @@ class EnhancedSignalProcessor:
     
     def get_queue_status(self) -> Dict[str, Any]:
         """Get current queue status"""
-        
-        status_counts = {}
-        for signal in self.signal_queue:
-            status = signal.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
         return {
             "queue_length": len(self.signal_queue),
             "total_signals": len(self.signal_queue) + len(self.processed_signals),
-            "status_counts": status_counts,
+            "status_counts": dict(self._status_counts),
             "timestamp": datetime.now().isoformat()
         }
     
-    async def process_queued_signals(self) -> Dict[str, Any]:
-        """Process all queued signals"""
-        
-        if not self.signal_queue:
-            return {
-                "processed_count": 0,
-                "failed_count": 0,
-                "total_count": 0,
-                "results": [],
-                "processed_at": datetime.now().isoformat()
-            }
-        
-        processed_count = 0
-        failed_count = 0
-        results = []
+    async def _execute_signal(self, signal: QueuedSignal) -> Dict[str, Any]:
+        """Execute a single queued signal and move it to the processed signals"""
         
-        # Process signals (move to processed list)
-        signals_to_process = self.signal_queue.copy()
-        self.signal_queue.clear()
+        if self._execution_semaphore is None:
+            self._execution_semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for signal in signals_to_process:
+        async with self._execution_semaphore:
             try:
+                now_iso = datetime.now().isoformat()
                 # Execute the trading pipeline result
-                signal_id = signal["signal_id"]
-                account_name = signal["account_name"]
-                trade_signal = signal["trade_signal"]
-                processing_result = signal.get("processing_result", {})
+                signal_id = signal.signal_id
+                account_name = signal.account_name
+                trade_signal = signal.trade_signal
+                processing_result = signal.processing_result
                 
                 if processing_result.get("success"):
                     # Mock order execution
@@ -359,66 +473,107 @@ class EnhancedSignalProcessor:
                     order_id = f"mock_order_{signal_id}"
                     
                     # Update signal status
-                    signal["status"] = "processed"
-                    signal["processed_at"] = datetime.now().isoformat()
-                    signal["order_id"] = order_id
+                    signal.status = "processed"
+                    signal.processed_at = now_iso
+                    signal.order_id = order_id
                     
-                    results.append({
+                    result = {
                         "signal_id": signal_id,
                         "status": "processed",
                         "account_name": account_name,
-                        "symbol": trade_signal["symbol"],
-                        "action": trade_signal["action"],
-                        "quantity": processing_result.get("suggested_quantity", trade_signal["quantity"]),
+                        "symbol": trade_signal.symbol,
+                        "action": trade_signal.action,
+                        "quantity": processing_result.get("suggested_quantity", trade_signal.quantity),
                         "selected_contract": processing_result.get("selected_contract", {}).get("symbol"),
                         "order_id": order_id,
                         "risk_result": processing_result.get("risk_result"),
-                        "processed_at": signal["processed_at"],
+                        "processed_at": now_iso,
                         "message": "Signal processed successfully through enhanced pipeline (mock mode)"
-                    })
-                    
-                    processed_count += 1
+                    }
                 else:
                     # Processing failed
                     error_msg = processing_result.get("error", "Unknown processing error")
-                    signal["status"] = "failed"
-                    signal["processed_at"] = datetime.now().isoformat()
-                    signal["error"] = error_msg
+                    signal.status = "failed"
+                    signal.processed_at = now_iso
+                    signal.error = error_msg
                     
-                    results.append({
+                    result = {
                         "signal_id": signal_id,
                         "status": "failed",
                         "account_name": account_name,
                         "error": error_msg,
                         "processing_step": processing_result.get("step"),
-                        "processed_at": signal["processed_at"]
-                    })
-                    
-                    failed_count += 1
+                        "processed_at": now_iso
+                    }
                 
                 # Move to processed signals
-                self.processed_signals[signal_id] = signal
+                self._store_processed(signal_id, signal)
+                return result
                 
             except Exception as e:
-                logger.error(f"Error processing signal {signal.get('signal_id')}: {e}")
-                
-                # Update signal status to failed
-                signal["status"] = "failed"
-                signal["processed_at"] = datetime.now().isoformat()
-                signal["error"] = str(e)
-                
-                # Move to processed signals
-                signal_id = signal.get("signal_id", "unknown")
-                self.processed_signals[signal_id] = signal
-                
-                results.append({
-                    "signal_id": signal_id,
-                    "status": "failed",
-                    "error": str(e),
-                    "processed_at": signal["processed_at"]
-                })
-                
+                return self._fail_signal(signal, e)
+    
+    def _store_processed(self, signal_id: str, signal: QueuedSignal) -> None:
+        """Record a processed signal, evicting the oldest beyond the size limit"""
+        self.processed_signals[signal_id] = signal
+        self.processed_signals.move_to_end(signal_id)
+        while len(self.processed_signals) > self._max_processed:
+            self.processed_signals.popitem(last=False)
+    
+    def _fail_signal(self, signal: QueuedSignal, error: BaseException) -> Dict[str, Any]:
+        """Mark a signal as failed after an unexpected execution error"""
+        logger.error(f"Error processing signal {signal.signal_id}: {error}")
+        
+        # Update signal status to failed
+        signal.status = "failed"
+        signal.processed_at = datetime.now().isoformat()
+        signal.error = str(error)
+        
+        # Move to processed signals
+        self._store_processed(signal.signal_id, signal)
+        
+        return {
+            "signal_id": signal.signal_id,
+            "status": "failed",
+            "error": str(error),
+            "processed_at": signal.processed_at
+        }
+    
+    async def process_queued_signals(self) -> Dict[str, Any]:
+        """Process all queued signals"""
+        
+        if not self.signal_queue:
+            return {
+                "processed_count": 0,
+                "failed_count": 0,
+                "total_count": 0,
+                "results": [],
+                "processed_at": datetime.now().isoformat()
+            }
+        
+        # Process signals (swap out the queue; signals move to the processed list)
+        signals_to_process = self.signal_queue
+        self.signal_queue = deque()
+        self._status_counts = Counter()
+        
+        outcomes = await asyncio.gather(
+            *(self._execute_signal(signal) for signal in signals_to_process),
+            return_exceptions=True
+        )
+        
+        processed_count = 0
+        failed_count = 0
+        results = []
+        
+        for signal, outcome in zip(signals_to_process, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = self._fail_signal(signal, outcome)
+            
+            if outcome["status"] == "processed":
+                processed_count += 1
+            else:
                 failed_count += 1
+            results.append(outcome)
         
         logger.info(f"Processed {processed_count} signals, {failed_count} failed")
         
@@ -2,9 +2,10 @@
 Mock Tiger Brokers API client for development and testing
 """
 
+import itertools
 import logging
-import uuid
-from typing import Optional, List, Dict, Any
+import math
+from typing import Optional, List, Dict, Any, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 import random
@@ -21,22 +22,147 @@ from ..models import (
     OrderStatus,
     OptionType,
 )
+from ..models.tiger import OCC_SYMBOL_RE
 
 
 logger = logging.getLogger(__name__)
 
+# Mock market parameters
+_MOCK_UNDERLYING_PRICE = Decimal('150.00')
+_MOCK_STRIKE_OFFSETS = range(-10, 11)
+_MOCK_STRIKE_STEP = 5
+_MOCK_RISK_FREE_RATE = 0.05
+
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+_PRICE_QUANTUM = Decimal('0.01')
+_RATIO_QUANTUM = Decimal('0.0001')
+
+
+def _to_price(value: float) -> Decimal:
+    """Convert a float price to a cent-precision Decimal"""
+    return Decimal(value).quantize(_PRICE_QUANTUM)
+
+
+def _to_ratio(value: float) -> Decimal:
+    """Convert a float Greek or volatility to a 4-place Decimal"""
+    return Decimal(value).quantize(_RATIO_QUANTUM)
+
+
+def _parse_occ_symbol(symbol: str) -> Optional[Tuple[str, datetime, Decimal, OptionType]]:
+    """
+    Split an OCC-style symbol into (underlying, expiry, strike, option_type)
+    
+    Returns None if the symbol doesn't match, its date code is not a real
+    date, or its strike is zero, so callers fall back to default quotes.
+    """
+    match = OCC_SYMBOL_RE.fullmatch(symbol)
+    if not match:
+        return None
+    
+    underlying, expiry_code, type_code, strike_code = match.groups()
+    strike_thousandths = int(strike_code)
+    if strike_thousandths <= 0:
+        return None
+    try:
+        expiry = datetime(2000 + int(expiry_code[:2]), int(expiry_code[2:4]), int(expiry_code[4:]))
+    except ValueError:
+        return None
+    
+    option_type = OptionType.CALL if type_code == 'C' else OptionType.PUT
+    return underlying, expiry, Decimal(strike_thousandths).scaleb(-3), option_type
+
+
+def _mock_option_values(
+    rng: random.Random,
+    S: float,
+    K: float,
+    T: float,
+    sqrt_t: float,
+    discount: float,
+    is_call: bool
+) -> Tuple[float, float, float, float, float, float, float, float]:
+    """
+    Price one mock contract in plain floats
+    
+    Returns (bid, ask, last, delta, gamma, theta, vega, iv). sqrt_t and
+    discount (exp(-rT)) are passed in so a chain computes them only once.
+    """
+    
+    # Mock implied volatility
+    iv = rng.uniform(0.15, 0.35)
+    
+    # Simple Black-Scholes approximation for mock prices
+    intrinsic = max(S - K, 0.0) if is_call else max(K - S, 0.0)
+    time_value = rng.uniform(0.5, 5.0) * T
+    
+    theoretical_price = intrinsic + time_value
+    
+    # Generate bid/ask around theoretical price
+    half_spread = theoretical_price * rng.uniform(0.02, 0.08) / 2
+    
+    bid = max(theoretical_price - half_spread, 0.01)
+    ask = theoretical_price + half_spread
+    last = bid + (ask - bid) * rng.random()
+    
+    # Black-Scholes Greeks, all derived from a single d1 evaluation
+    vol_sqrt_t = iv * sqrt_t
+    d1 = (math.log(S / K) + (_MOCK_RISK_FREE_RATE + 0.5 * iv * iv) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    cdf_d1 = 0.5 * (1.0 + math.erf(d1 / _SQRT_2))
+    cdf_d2 = 0.5 * (1.0 + math.erf(d2 / _SQRT_2))
+    pdf_d1 = math.exp(-0.5 * d1 * d1) / _SQRT_2PI
+    discounted_rate = _MOCK_RISK_FREE_RATE * K * discount
+    decay = -S * pdf_d1 * iv / (2 * sqrt_t)
+    
+    if is_call:
+        delta = cdf_d1
+        theta = (decay - discounted_rate * cdf_d2) / 365
+    else:
+        delta = cdf_d1 - 1
+        theta = (decay + discounted_rate * (1 - cdf_d2)) / 365
+    
+    gamma = pdf_d1 / (S * vol_sqrt_t)
+    vega = S * pdf_d1 * sqrt_t / 100  # per 1% change in volatility
+    
+    return bid, ask, last, delta, gamma, theta, vega, iv
+
+
+def _mock_chain_values(
+    rng: random.Random,
+    S: float,
+    strikes: List[float],
+    T: float
+) -> List[Tuple[float, ...]]:
+    """Price a whole mock chain: a call then a put for every strike"""
+    
+    sqrt_t = math.sqrt(T)
+    discount = math.exp(-_MOCK_RISK_FREE_RATE * T)
+    
+    values = []
+    for K in strikes:
+        values.append(_mock_option_values(rng, S, K, T, sqrt_t, discount, True))
+        values.append(_mock_option_values(rng, S, K, T, sqrt_t, discount, False))
+    return values
+
 
 class MockTigerClient:
     """Mock Tiger Brokers API client for development and testing"""
     
-    def __init__(self, account_config: AccountConfig):
-        """Initialize mock Tiger client"""
+    def __init__(self, account_config: AccountConfig, seed: Optional[int] = None):
+        """Initialize mock Tiger client (pass seed for reproducible mock data)"""
         self.account_config = account_config
         
         # Mock data storage
         self._orders: Dict[str, TigerOrder] = {}
+        # status value -> ids of orders currently in that status (dict as an ordered set)
+        self._order_ids_by_status: Dict[str, Dict[str, None]] = {}
         self._positions: Dict[str, Position] = {}
+        self._currency = Currency(account_config.default_currency)
         self._account_info = self._generate_mock_account()
+        self._rng = random.Random(seed)
+        self._order_seq = itertools.count(1)
         
         logger.info(f"Initialized Mock Tiger client for account: {account_config.name}")
     
@@ -44,7 +170,7 @@ class MockTigerClient:
         """Generate mock account information"""
         return TigerAccount(
             account=self.account_config.account,
-            currency=Currency(self.account_config.default_currency),
+            currency=self._currency,
             buying_power=Decimal('100000.00'),
             cash=Decimal('50000.00'),
             market_value=Decimal('75000.00'),
@@ -71,44 +197,51 @@ class MockTigerClient:
     def get_option_expirations(self, symbol: str) -> List[datetime]:
         """Get mock option expiration dates"""
         base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        expirations = []
-        
-        # Generate weekly and monthly expirations
-        for weeks in [1, 2, 3, 4, 8, 12, 16, 20]:
-            expiry = base_date + timedelta(weeks=weeks)
-            # Adjust to Friday
-            expiry = expiry + timedelta(days=(4 - expiry.weekday()) % 7)
-            expirations.append(expiry)
-        
-        return sorted(expirations)
+        # Whole weeks keep the weekday, so one Friday adjustment fits every expiry
+        friday_offset = (4 - base_date.weekday()) % 7
+        
+        # Generate weekly and monthly expirations (already in ascending order)
+        return [
+            base_date + timedelta(weeks=weeks, days=friday_offset)
+            for weeks in (1, 2, 3, 4, 8, 12, 16, 20)
+        ]
     
     def get_option_chain(self, symbol: str, expiry: datetime) -> List[OptionContract]:
         """Get mock option chain"""
         # Mock current stock price
-        current_price = Decimal('150.00')  # Mock price for testing
+        current_price = _MOCK_UNDERLYING_PRICE
+        
+        # Inputs shared by every contract in the chain are computed once
+        time_to_expiry = self._time_to_expiry(expiry)
+        strikes = [current_price + offset * _MOCK_STRIKE_STEP for offset in _MOCK_STRIKE_OFFSETS]
+        prefix = f"{symbol}  {expiry.strftime('%y%m%d')}"
+        
+        values = _mock_chain_values(
+            self._rng, float(current_price), [float(strike) for strike in strikes], time_to_expiry
+        )
         
         contracts = []
         
-        # Generate strikes around current price
-        for strike_offset in range(-10, 11):
-            strike = current_price + Decimal(str(strike_offset * 5))
-            
-            # Generate call option
-            call_symbol = f"{symbol}  {expiry.strftime('%y%m%d')}C{strike:08.0f}000"
-            call_contract = self._generate_mock_option_contract(
-                call_symbol, symbol, strike, expiry, OptionType.CALL, current_price
-            )
-            contracts.append(call_contract)
+        # Generate strikes around current price; values hold a call then a put per strike
+        for i, strike in enumerate(strikes):
+            call_symbol = f"{prefix}C{strike:08.0f}000"
+            contracts.append(self._contract_from_values(
+                call_symbol, symbol, strike, expiry, OptionType.CALL, values[2 * i]
+            ))
             
-            # Generate put option
-            put_symbol = f"{symbol}  {expiry.strftime('%y%m%d')}P{strike:08.0f}000"
-            put_contract = self._generate_mock_option_contract(
-                put_symbol, symbol, strike, expiry, OptionType.PUT, current_price
-            )
-            contracts.append(put_contract)
+            put_symbol = f"{prefix}P{strike:08.0f}000"
+            contracts.append(self._contract_from_values(
+                put_symbol, symbol, strike, expiry, OptionType.PUT, values[2 * i + 1]
+            ))
         
         return contracts
     
+    @staticmethod
+    def _time_to_expiry(expiry: datetime, now: Optional[datetime] = None) -> float:
+        """Calculate time to expiry in years"""
+        days_to_expiry = (expiry - (now or datetime.now())).days
+        return max(days_to_expiry / 365.0, 0.01)
+    
     def _generate_mock_option_contract(
         self,
         symbol: str,
@@ -116,46 +249,39 @@ class MockTigerClient:
         strike: Decimal,
         expiry: datetime,
         option_type: OptionType,
-        underlying_price: Decimal
+        underlying_price: Decimal,
+        time_to_expiry: Optional[float] = None
     ) -> OptionContract:
         """Generate a mock option contract with realistic data"""
         
         # Calculate time to expiry in years
-        days_to_expiry = (expiry - datetime.now()).days
-        time_to_expiry = max(days_to_expiry / 365.0, 0.01)
-        
-        # Mock implied volatility
-        iv = Decimal(str(random.uniform(0.15, 0.35)))
-        
-        # Simple Black-Scholes approximation for mock prices
-        moneyness = underlying_price / strike
-        if option_type == OptionType.CALL:
-            intrinsic = max(underlying_price - strike, Decimal('0'))
-            time_value = Decimal(str(random.uniform(0.5, 5.0))) * Decimal(str(time_to_expiry))
-        else:
-            intrinsic = max(strike - underlying_price, Decimal('0'))
-            time_value = Decimal(str(random.uniform(0.5, 5.0))) * Decimal(str(time_to_expiry))
-        
-        theoretical_price = intrinsic + time_value
-        
-        # Generate bid/ask around theoretical price
-        spread_pct = Decimal(str(random.uniform(0.02, 0.08)))
-        spread = theoretical_price * spread_pct
-        
-        bid = max(theoretical_price - spread / 2, Decimal('0.01'))
-        ask = theoretical_price + spread / 2
-        last = bid + (ask - bid) * Decimal(str(random.random()))
-        
-        # Mock Greeks
-        if option_type == OptionType.CALL:
-            delta = Decimal(str(min(0.99, max(0.01, 0.5 + float(moneyness - 1) * 2))))
-        else:
-            delta = Decimal(str(max(-0.99, min(-0.01, -0.5 + float(moneyness - 1) * 2))))
-        
-        gamma = Decimal(str(random.uniform(0.001, 0.05)))
-        theta = Decimal(str(random.uniform(-0.1, -0.01)))
-        vega = Decimal(str(random.uniform(0.05, 0.3)))
+        if time_to_expiry is None:
+            time_to_expiry = self._time_to_expiry(expiry)
+        
+        values = _mock_option_values(
+            self._rng,
+            float(underlying_price),
+            float(strike),
+            time_to_expiry,
+            math.sqrt(time_to_expiry),
+            math.exp(-_MOCK_RISK_FREE_RATE * time_to_expiry),
+            option_type == OptionType.CALL,
+        )
+        return self._contract_from_values(symbol, underlying, strike, expiry, option_type, values)
+    
+    def _contract_from_values(
+        self,
+        symbol: str,
+        underlying: str,
+        strike: Decimal,
+        expiry: datetime,
+        option_type: OptionType,
+        values: Tuple[float, ...]
+    ) -> OptionContract:
+        """Wrap kernel output in an OptionContract"""
         
+        bid, ask, last, delta, gamma, theta, vega, iv = values
+        rng = self._rng
         return OptionContract(
             symbol=symbol,
             underlying_symbol=underlying,
@@ -163,33 +289,39 @@ class MockTigerClient:
             expiry=expiry,
             option_type=option_type,
             multiplier=100,
-            bid=bid,
-            ask=ask,
-            last=last,
-            volume=random.randint(0, 1000),
-            open_interest=random.randint(0, 5000),
-            delta=delta,
-            gamma=gamma,
-            theta=theta,
-            vega=vega,
-            implied_volatility=iv,
+            bid=_to_price(bid),
+            ask=_to_price(ask),
+            last=_to_price(last),
+            volume=rng.randint(0, 1000),
+            open_interest=rng.randint(0, 5000),
+            delta=_to_ratio(delta),
+            gamma=_to_ratio(gamma),
+            theta=_to_ratio(theta),
+            vega=_to_ratio(vega),
+            implied_volatility=_to_ratio(iv),
         )
     
     def get_option_quotes(self, symbols: List[str]) -> Dict[str, OptionContract]:
         """Get mock option quotes"""
         quotes = {}
+        now = datetime.now()
+        default_expiry = now + timedelta(days=30)  # Mock expiry
         
         for symbol in symbols:
-            # Parse symbol to extract details (simplified)
-            underlying = symbol.split()[0] if ' ' in symbol else 'AAPL'
-            strike = Decimal('150.00')  # Mock strike
-            expiry = datetime.now() + timedelta(days=30)  # Mock expiry
-            option_type = OptionType.CALL if 'C' in symbol else OptionType.PUT
+            parsed = _parse_occ_symbol(symbol)
+            if parsed is not None:
+                underlying, expiry, strike, option_type = parsed
+            else:
+                # Parse symbol to extract details (simplified)
+                underlying = symbol.split()[0] if ' ' in symbol else 'AAPL'
+                expiry = default_expiry
+                strike = _MOCK_UNDERLYING_PRICE  # Mock strike
+                option_type = OptionType.CALL if 'C' in symbol else OptionType.PUT
             
-            contract = self._generate_mock_option_contract(
-                symbol, underlying, strike, expiry, option_type, Decimal('150.00')
+            quotes[symbol] = self._generate_mock_option_contract(
+                symbol, underlying, strike, expiry, option_type, _MOCK_UNDERLYING_PRICE,
+                self._time_to_expiry(expiry, now)
             )
-            quotes[symbol] = contract
         
         return quotes
 
@@ -205,30 +337,23 @@ class MockTigerClient:
 
     def get_trades(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get mock trade history"""
+        rng = self._rng
+        now = datetime.now()
         trades = []
         for i in range(min(limit, 10)):  # Generate up to 10 mock trades
             trade = {
-                "trade_time": (datetime.now() - timedelta(days=i)).isoformat(),
+                "trade_time": (now - timedelta(days=i)).isoformat(),
                 "symbol": f"AAPL  250117C00150000",
                 "underlying": "AAPL",
                 "side": "buy" if i % 2 == 0 else "sell",
-                "quantity": random.randint(1, 10),
-                "price": round(random.uniform(1.0, 5.0), 2),
-                "commission": round(random.uniform(0.5, 2.0), 2),
-                "realized_pnl": round(random.uniform(-100, 100), 2)
+                "quantity": rng.randint(1, 10),
+                "price": round(rng.uniform(1.0, 5.0), 2),
+                "commission": round(rng.uniform(0.5, 2.0), 2),
+                "realized_pnl": round(rng.uniform(-100, 100), 2)
             }
             trades.append(trade)
         return trades
 
-    def cancel_order(self, order_id: str) -> Dict[str, Any]:
-        """Cancel an order (mock implementation)"""
-        logger.info(f"Mock: Cancelling order {order_id}")
-        return {
-            "order_id": order_id,
-            "status": "cancelled",
-            "cancelled_at": datetime.now().isoformat()
-        }
-
     def close_position(self, symbol: str) -> Dict[str, Any]:
         """Close a position (mock implementation)"""
         logger.info(f"Mock: Closing position {symbol}")
@@ -238,52 +363,6 @@ class MockTigerClient:
             "closed_at": datetime.now().isoformat()
         }
 
-    def get_option_chain(self, symbol: str) -> List[Dict[str, Any]]:
-        """Get option chain for symbol (mock implementation)"""
-
-        try:
-            # Generate mock option chain data
-            option_chain = []
-
-            # Generate call options
-            for strike in [140, 145, 150, 155, 160]:
-                call_contract = {
-                    "symbol": f"{symbol}  250117C{strike:08.0f}000",
-                    "underlying": symbol,
-                    "strike": strike,
-                    "expiry": "2025-01-17T00:00:00",
-                    "option_type": "call",
-                    "bid": 2.50,
-                    "ask": 2.70,
-                    "last_price": 2.60,
-                    "volume": 100,
-                    "open_interest": 500
-                }
-                option_chain.append(call_contract)
-
-            # Generate put options
-            for strike in [140, 145, 150, 155, 160]:
-                put_contract = {
-                    "symbol": f"{symbol}  250117P{strike:08.0f}000",
-                    "underlying": symbol,
-                    "strike": strike,
-                    "expiry": "2025-01-17T00:00:00",
-                    "option_type": "put",
-                    "bid": 1.80,
-                    "ask": 2.00,
-                    "last_price": 1.90,
-                    "volume": 80,
-                    "open_interest": 300
-                }
-                option_chain.append(put_contract)
-
-            logger.info(f"Generated mock option chain for {symbol}: {len(option_chain)} contracts")
-            return option_chain
-
-        except Exception as e:
-            logger.error(f"Failed to generate mock option chain for {symbol}: {e}")
-            return []
-
     # Trading Methods
     
     def place_order(
@@ -297,7 +376,8 @@ class MockTigerClient:
         time_in_force: str = "day"
     ) -> Optional[str]:
         """Place a mock order"""
-        order_id = str(uuid.uuid4())
+        order_id = f"MO{next(self._order_seq):08x}"
+        now = datetime.now()
         
         # Create mock order
         order = TigerOrder(
@@ -313,17 +393,17 @@ class MockTigerClient:
             status=OrderStatus.SUBMITTED,
             filled_quantity=Decimal('0'),
             avg_fill_price=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             commission=None,
-            currency=Currency(self.account_config.default_currency),
+            currency=self._currency,
         )
         
-        self._orders[order_id] = order
+        self._store_order(order)
         
         # Simulate order fill for market orders
         if order_type == OrderType.MARKET:
-            self._simulate_order_fill(order_id)
+            self._simulate_order_fill(order_id, now)
         
         logger.info(f"Mock order placed: {order_id} for {symbol}")
         return order_id
@@ -333,8 +413,11 @@ class MockTigerClient:
         if order_id in self._orders:
             order = self._orders[order_id]
             if order.status in [OrderStatus.SUBMITTED, OrderStatus.PENDING]:
-                order.status = OrderStatus.CANCELLED
-                order.updated_at = datetime.now()
+                self._store_order(TigerOrder.model_validate({
+                    **order.model_dump(),
+                    "status": OrderStatus.CANCELLED,
+                    "updated_at": datetime.now(),
+                }))
                 logger.info(f"Mock order cancelled: {order_id}")
                 return True
         
@@ -343,14 +426,23 @@ class MockTigerClient:
     
     def get_orders(self, status: Optional[str] = None) -> List[TigerOrder]:
         """Get mock orders"""
-        orders = list(self._orders.values())
-        
-        if status:
-            orders = [order for order in orders if order.status.value == status]
+        if not status:
+            return list(self._orders.values())
         
-        return orders
+        # Ids are fixed-width counters, so sorting restores placement order
+        order_ids = self._order_ids_by_status.get(status, ())
+        return [self._orders[order_id] for order_id in sorted(order_ids)]
     
-    def _simulate_order_fill(self, order_id: str):
+    def _store_order(self, order: TigerOrder):
+        """Store an order and keep the status index in step"""
+        previous = self._orders.get(order.order_id)
+        if previous is not None:
+            self._order_ids_by_status[previous.status.value].pop(order.order_id, None)
+        
+        self._orders[order.order_id] = order
+        self._order_ids_by_status.setdefault(order.status.value, {})[order.order_id] = None
+    
+    def _simulate_order_fill(self, order_id: str, now: Optional[datetime] = None):
         """Simulate order fill for testing"""
         if order_id not in self._orders:
             return
@@ -358,19 +450,23 @@ class MockTigerClient:
         order = self._orders[order_id]
         
         # Simulate partial or full fill
-        fill_ratio = random.uniform(0.8, 1.0)  # 80-100% fill
+        fill_ratio = self._rng.uniform(0.8, 1.0)  # 80-100% fill
         filled_qty = order.quantity * Decimal(str(fill_ratio))
         
         # Mock fill price
         if order.price:
-            fill_price = order.price * Decimal(str(random.uniform(0.99, 1.01)))
+            fill_price = order.price * Decimal(str(self._rng.uniform(0.99, 1.01)))
         else:
             fill_price = Decimal('150.00')  # Mock market price
         
-        order.filled_quantity = filled_qty
-        order.avg_fill_price = fill_price
-        order.status = OrderStatus.FILLED if filled_qty == order.quantity else OrderStatus.PARTIAL_FILLED
-        order.updated_at = datetime.now()
+        order = TigerOrder.model_validate({
+            **order.model_dump(),
+            "filled_quantity": filled_qty,
+            "avg_fill_price": fill_price,
+            "status": OrderStatus.FILLED if filled_qty == order.quantity else OrderStatus.PARTIAL_FILLED,
+            "updated_at": now or datetime.now(),
+        })
+        self._store_order(order)
         
         # Update positions
         self._update_position(order.symbol, order.side, filled_qty, fill_price)
@@ -387,8 +483,8 @@ class MockTigerClient:
                 market_value=Decimal('0'),
                 unrealized_pnl=Decimal('0'),
                 realized_pnl=Decimal('0'),
-                currency=Currency(self.account_config.default_currency),
-                multiplier=100 if 'option' in symbol.lower() else 1,
+                currency=self._currency,
+                multiplier=100 if OCC_SYMBOL_RE.fullmatch(symbol) else 1,
             )
         
         position = self._positions[symbol]
@@ -400,14 +496,20 @@ class MockTigerClient:
             new_quantity = position.quantity - quantity
         
         # Update average cost
+        avg_cost = position.avg_cost
         if new_quantity != 0:
             total_cost = position.quantity * position.avg_cost + quantity * price
-            position.avg_cost = total_cost / new_quantity
-        
-        position.quantity = new_quantity
-        position.market_price = price
-        position.market_value = new_quantity * price * position.multiplier
+            avg_cost = total_cost / new_quantity
         
         # Remove position if quantity is zero
-        if position.quantity == 0:
+        if new_quantity == 0:
             del self._positions[symbol]
+            return
+        
+        self._positions[symbol] = Position.model_validate({
+            **position.model_dump(),
+            "quantity": new_quantity,
+            "avg_cost": avg_cost,
+            "market_price": price,
+            "market_value": new_quantity * price * position.multiplier,
+        })
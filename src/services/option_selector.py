@@ -6,7 +6,7 @@ based on trading signals and market conditions.
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
 from typing import List, Optional, Dict, Any, Tuple
 from decimal import Decimal
 from enum import Enum
@@ -33,6 +33,10 @@ class SelectionStrategy(Enum):
     TIGHT_SPREAD = "tight_spread"   # Options with tight bid-ask spreads
 
 
+# Strategies whose selector does not take the underlying price
+_PRICE_FREE_STRATEGIES = frozenset({SelectionStrategy.HIGH_VOLUME, SelectionStrategy.TIGHT_SPREAD})
+
+
 class OptionSelector:
     """
     Option contract selection service
@@ -45,6 +49,15 @@ class OptionSelector:
         """Initialize option selector with account configuration"""
         self.account_config = account_config
         self.logger = logging.getLogger(f"{__name__}.{account_config.name}")
+        
+        # Strategies without an entry fall back to ATM
+        self._strategy_map = {
+            SelectionStrategy.ATM: self._select_atm_contract,
+            SelectionStrategy.OTM: self._select_otm_contract,
+            SelectionStrategy.ITM: self._select_itm_contract,
+            SelectionStrategy.HIGH_VOLUME: self._select_high_volume_contract,
+            SelectionStrategy.TIGHT_SPREAD: self._select_tight_spread_contract,
+        }
     
     def select_option_contract(
         self,
@@ -71,19 +84,8 @@ class OptionSelector:
             return None
         
         try:
-            # Filter contracts by option type based on signal action
-            option_type = self._determine_option_type(signal)
-            filtered_contracts = self._filter_by_option_type(option_chain, option_type)
-            
-            if not filtered_contracts:
-                self.logger.warning(f"No {option_type.value} contracts available")
-                return None
-            
-            # Filter by expiration date
-            filtered_contracts = self._filter_by_expiration(filtered_contracts)
-            
+            filtered_contracts = self._prefilter_contracts(signal, option_chain)
             if not filtered_contracts:
-                self.logger.warning("No contracts with suitable expiration dates")
                 return None
             
             # Apply selection strategy
@@ -105,6 +107,29 @@ class OptionSelector:
             self.logger.error(f"Error selecting option contract: {e}")
             return None
     
+    def _prefilter_contracts(
+        self,
+        signal: TradeSignal,
+        option_chain: List[OptionContract]
+    ) -> List[OptionContract]:
+        """Filter the chain down to contracts of the signal's option type and a suitable expiry"""
+        
+        # Filter contracts by option type based on signal action
+        option_type = self._determine_option_type(signal)
+        filtered_contracts = self._filter_by_option_type(option_chain, option_type)
+        
+        if not filtered_contracts:
+            self.logger.warning(f"No {option_type.value} contracts available")
+            return []
+        
+        # Filter by expiration date
+        filtered_contracts = self._filter_by_expiration(filtered_contracts)
+        
+        if not filtered_contracts:
+            self.logger.warning("No contracts with suitable expiration dates")
+        
+        return filtered_contracts
+    
     def _determine_option_type(self, signal: TradeSignal) -> OptionType:
         """Determine option type (call/put) based on signal action"""
         
@@ -145,24 +170,14 @@ class OptionSelector:
             max_days: Maximum days to expiration
         """
         
-        now = datetime.now()
-        min_expiry = now + timedelta(days=min_days)
-        max_expiry = now + timedelta(days=max_days)
-        
-        filtered = []
-        for contract in contracts:
-            if contract.expiry:
-                expiry_date = contract.expiry
-                if isinstance(expiry_date, str):
-                    try:
-                        expiry_date = datetime.fromisoformat(expiry_date.replace('Z', '+00:00'))
-                    except ValueError:
-                        continue
-                
-                if min_expiry <= expiry_date <= max_expiry:
-                    filtered.append(contract)
-        
-        return filtered
+        now_ts = time.time()
+        min_ts = now_ts + min_days * 86400
+        max_ts = now_ts + max_days * 86400
+        
+        return [
+            contract for contract in contracts
+            if min_ts <= contract.expiry_ts <= max_ts
+        ]
     
     def _apply_selection_strategy(
         self,
@@ -172,19 +187,10 @@ class OptionSelector:
     ) -> Optional[OptionContract]:
         """Apply the specified selection strategy"""
         
-        if strategy == SelectionStrategy.ATM:
-            return self._select_atm_contract(contracts, current_price)
-        elif strategy == SelectionStrategy.OTM:
-            return self._select_otm_contract(contracts, current_price)
-        elif strategy == SelectionStrategy.ITM:
-            return self._select_itm_contract(contracts, current_price)
-        elif strategy == SelectionStrategy.HIGH_VOLUME:
-            return self._select_high_volume_contract(contracts)
-        elif strategy == SelectionStrategy.TIGHT_SPREAD:
-            return self._select_tight_spread_contract(contracts)
-        else:
-            # Default to ATM
-            return self._select_atm_contract(contracts, current_price)
+        select = self._strategy_map.get(strategy, self._select_atm_contract)
+        if strategy in _PRICE_FREE_STRATEGIES:
+            return select(contracts)
+        return select(contracts, current_price)
     
     def _select_atm_contract(
         self, 
@@ -197,17 +203,12 @@ class OptionSelector:
             return None
         
         # Find contract with strike closest to current price
-        best_contract = None
-        min_distance = float('inf')
-        
-        for contract in contracts:
-            if contract.strike:
-                distance = abs(float(contract.strike) - float(current_price))
-                if distance < min_distance:
-                    min_distance = distance
-                    best_contract = contract
-        
-        return best_contract
+        price = float(current_price)
+        return min(
+            (c for c in contracts if c.strike),
+            key=lambda c: abs(c.strike_f - price),
+            default=None
+        )
     
     def _select_otm_contract(
         self, 
@@ -221,25 +222,19 @@ class OptionSelector:
         
         # For calls: strike > current_price
         # For puts: strike < current_price
-        otm_contracts = []
-        
-        for contract in contracts:
-            if not contract.strike:
-                continue
-                
-            if contract.option_type == OptionType.CALL:
-                if contract.strike > current_price:
-                    otm_contracts.append(contract)
-            elif contract.option_type == OptionType.PUT:
-                if contract.strike < current_price:
-                    otm_contracts.append(contract)
-        
-        if not otm_contracts:
-            return None
-        
-        # Select the first OTM contract (closest to ATM)
-        otm_contracts.sort(key=lambda x: abs(float(x.strike) - float(current_price)))
-        return otm_contracts[0]
+        # Select the OTM contract closest to ATM in a single pass
+        price = float(current_price)
+        return min(
+            (
+                c for c in contracts
+                if c.strike and (
+                    (c.option_type == OptionType.CALL and c.strike_f > price)
+                    or (c.option_type == OptionType.PUT and c.strike_f < price)
+                )
+            ),
+            key=lambda c: abs(c.strike_f - price),
+            default=None
+        )
     
     def _select_itm_contract(
         self, 
@@ -253,25 +248,19 @@ class OptionSelector:
         
         # For calls: strike < current_price
         # For puts: strike > current_price
-        itm_contracts = []
-        
-        for contract in contracts:
-            if not contract.strike:
-                continue
-                
-            if contract.option_type == OptionType.CALL:
-                if contract.strike < current_price:
-                    itm_contracts.append(contract)
-            elif contract.option_type == OptionType.PUT:
-                if contract.strike > current_price:
-                    itm_contracts.append(contract)
-        
-        if not itm_contracts:
-            return None
-        
-        # Select the first ITM contract (closest to ATM)
-        itm_contracts.sort(key=lambda x: abs(float(x.strike) - float(current_price)))
-        return itm_contracts[0]
+        # Select the ITM contract closest to ATM in a single pass
+        price = float(current_price)
+        return min(
+            (
+                c for c in contracts
+                if c.strike and (
+                    (c.option_type == OptionType.CALL and c.strike_f < price)
+                    or (c.option_type == OptionType.PUT and c.strike_f > price)
+                )
+            ),
+            key=lambda c: abs(c.strike_f - price),
+            default=None
+        )
     
     def _select_high_volume_contract(
         self, 
@@ -282,15 +271,15 @@ class OptionSelector:
         if not contracts:
             return None
         
-        # Sort by volume (descending)
-        volume_contracts = [c for c in contracts if c.volume and c.volume > 0]
-        
-        if not volume_contracts:
-            # Fallback to first contract if no volume data
-            return contracts[0]
+        # Pick the highest volume in a single pass
+        best = max(
+            (c for c in contracts if c.volume and c.volume > 0),
+            key=lambda c: c.volume,
+            default=None
+        )
         
-        volume_contracts.sort(key=lambda x: x.volume, reverse=True)
-        return volume_contracts[0]
+        # Fallback to first contract if no volume data
+        return best if best is not None else contracts[0]
     
     def _select_tight_spread_contract(
         self, 
@@ -301,22 +290,15 @@ class OptionSelector:
         if not contracts:
             return None
         
-        # Calculate spreads and select tightest
-        spread_contracts = []
+        # Select the tightest spread percentage in a single pass
+        best = min(
+            (c for c in contracts if c.bid and c.ask and c.bid > 0 and c.ask > 0),
+            key=lambda c: (c.ask_f - c.bid_f) / c.ask_f,
+            default=None
+        )
         
-        for contract in contracts:
-            if contract.bid and contract.ask and contract.bid > 0 and contract.ask > 0:
-                spread = float(contract.ask) - float(contract.bid)
-                spread_pct = spread / float(contract.ask) if contract.ask > 0 else float('inf')
-                spread_contracts.append((contract, spread_pct))
-        
-        if not spread_contracts:
-            # Fallback to first contract if no bid/ask data
-            return contracts[0]
-        
-        # Sort by spread percentage (ascending)
-        spread_contracts.sort(key=lambda x: x[1])
-        return spread_contracts[0][0]
+        # Fallback to first contract if no bid/ask data
+        return best if best is not None else contracts[0]
     
     def get_selection_recommendations(
         self,
@@ -330,14 +312,26 @@ class OptionSelector:
         Returns a dictionary with strategy names as keys and selected contracts as values
         """
         
+        # Filter once and run every strategy against the same contracts
+        filtered_contracts = []
+        if not option_chain:
+            self.logger.warning("No option contracts available for selection")
+        else:
+            try:
+                filtered_contracts = self._prefilter_contracts(signal, option_chain)
+            except Exception as e:
+                self.logger.error(f"Error filtering option contracts: {e}")
+        
+        if not filtered_contracts:
+            return {strategy.value: None for strategy in SelectionStrategy}
+        
         recommendations = {}
         
         for strategy in SelectionStrategy:
             try:
-                selected = self.select_option_contract(
-                    signal, option_chain, current_price, strategy
+                recommendations[strategy.value] = self._apply_selection_strategy(
+                    filtered_contracts, current_price, strategy
                 )
-                recommendations[strategy.value] = selected
             except Exception as e:
                 self.logger.error(f"Error getting recommendation for {strategy.value}: {e}")
                 recommendations[strategy.value] = None
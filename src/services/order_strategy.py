@@ -8,7 +8,7 @@ including market orders, limit orders, stop orders, and advanced strategies.
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
 from enum import Enum
 
 from ..models import (
@@ -23,6 +23,44 @@ from ..config import AccountConfig
 
 logger = logging.getLogger(__name__)
 
+# Prices are computed in integer ticks of 1/10000 and only turned back into
+# Decimals when the order parameters are built; every step rounds half-even
+# to the nearest tick
+_TICKS_PER_UNIT = 10000
+
+# Default stop-loss and profit-target percentages shared by the order builders
+_D_010 = Decimal("0.10")
+_D_020 = Decimal("0.20")
+
+
+def _to_ticks(value: Decimal) -> int:
+    """Convert a Decimal price or ratio to integer ticks"""
+    return int(_as_decimal(value).scaleb(4).to_integral_value(ROUND_HALF_EVEN))
+
+
+def _div_round(numerator: int, denominator: int) -> int:
+    """Integer division rounded half-even (denominator > 0)"""
+    quotient, remainder = divmod(numerator, denominator)
+    twice = remainder * 2
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def _from_ticks(ticks: Optional[int]) -> Optional[Decimal]:
+    """Convert integer ticks back to a Decimal price"""
+    return Decimal(ticks).scaleb(-4) if ticks is not None else None
+
+
+def _as_decimal(value: Any) -> Decimal:
+    """Return value as a Decimal, parsing only when it is not one already"""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _offset_ticks(price_ticks: int, offset_ticks: int) -> int:
+    """Move a tick price by a signed fraction of itself, also in ticks (100 = +1%)"""
+    return _div_round(price_ticks * (_TICKS_PER_UNIT + offset_ticks), _TICKS_PER_UNIT)
+
 
 class OrderStrategy(Enum):
     """Order execution strategies"""
@@ -44,6 +82,86 @@ class PriceCalculationMethod(Enum):
     THEORETICAL_PRICE = "theoretical_price"
 
 
+# (strategy, is_buy) -> (price method, signed offset from that price in ticks)
+# Aggressive orders lean toward the far side of the book, conservative ones
+# toward the near side
+_PRICE_RULES = {
+    (OrderStrategy.LIMIT_AGGRESSIVE, True): (PriceCalculationMethod.ASK_PRICE, -100),      # Slightly below ask
+    (OrderStrategy.LIMIT_AGGRESSIVE, False): (PriceCalculationMethod.BID_PRICE, 100),      # Slightly above bid
+    (OrderStrategy.LIMIT_CONSERVATIVE, True): (PriceCalculationMethod.BID_PRICE, 100),     # Slightly above bid
+    (OrderStrategy.LIMIT_CONSERVATIVE, False): (PriceCalculationMethod.ASK_PRICE, -100),   # Slightly below ask
+}
+
+
+class OrderParams:
+    """Parameters of an order built by OrderStrategyService"""
+    
+    __slots__ = (
+        "symbol",
+        "order_type",
+        "side",
+        "quantity",
+        "price",
+        "time_in_force",
+        "strategy",
+        "signal_id",
+        "created_at",
+        "stop_price",
+        "parent_order",
+    )
+    
+    def __init__(
+        self,
+        symbol: str,
+        order_type: OrderType,
+        side: OrderSide,
+        quantity: Decimal,
+        price: Optional[Decimal],
+        time_in_force: str,
+        strategy: str,
+        signal_id: str,
+        created_at: str,
+        stop_price: Optional[Decimal] = None,
+        parent_order: Optional[str] = None
+    ):
+        self.symbol = symbol
+        self.order_type = order_type
+        self.side = side
+        self.quantity = quantity
+        self.price = price
+        self.time_in_force = time_in_force
+        self.strategy = strategy
+        self.signal_id = signal_id
+        self.created_at = created_at
+        self.stop_price = stop_price
+        self.parent_order = parent_order
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Order parameters as a plain dict for results and API responses"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Fields validate_order_parameters requires to be set
+_REQUIRED_ORDER_FIELDS = ("symbol", "order_type", "side", "quantity")
+
+# Validation messages, built once
+_ERR_MISSING_FIELD = {field: f"Missing required field: {field}" for field in _REQUIRED_ORDER_FIELDS}
+_ERR_QTY_POSITIVE = "Quantity must be positive"
+_ERR_QTY_FORMAT = "Invalid quantity format"
+_ERR_PRICE_REQUIRED = "Price required for limit orders"
+_ERR_PRICE_POSITIVE = "Price must be positive"
+_ERR_PRICE_FORMAT = "Invalid price format"
+_ERR_STOP_REQUIRED = "Stop price required for stop orders"
+_ERR_STOP_POSITIVE = "Stop price must be positive"
+_ERR_STOP_FORMAT = "Invalid stop price format"
+
+# Strategies not listed here are placed as limit orders
+_STRATEGY_ORDER_TYPES = {
+    OrderStrategy.MARKET: OrderType.MARKET,
+    OrderStrategy.STOP_LOSS: OrderType.STOP,
+}
+
+
 class OrderStrategyService:
     """
     Order strategy service for options trading
@@ -56,14 +174,24 @@ class OrderStrategyService:
         """Initialize order strategy service"""
         self.account_config = account_config
         self.logger = logging.getLogger(f"{__name__}.{account_config.name}")
+        self._max_size_error = f"Quantity exceeds max position size: {account_config.max_position_size}"
+        
+        self._price_fns = {
+            PriceCalculationMethod.BID_ASK_MIDPOINT: self._midpoint_ticks,
+            PriceCalculationMethod.LAST_PRICE: self._last_ticks,
+            PriceCalculationMethod.BID_PRICE: self._bid_ticks,
+            PriceCalculationMethod.ASK_PRICE: self._ask_ticks,
+            PriceCalculationMethod.THEORETICAL_PRICE: self._theoretical_ticks,
+        }
     
     def create_order(
         self,
         signal: TradeSignal,
         contract: OptionContract,
         strategy: OrderStrategy = OrderStrategy.LIMIT_MIDPOINT,
-        quantity: Optional[Decimal] = None
-    ) -> Optional[Dict[str, Any]]:
+        quantity: Optional[Decimal] = None,
+        now_iso: Optional[str] = None
+    ) -> Optional[OrderParams]:
         """
         Create an order based on signal, contract, and strategy
         
@@ -72,9 +200,10 @@ class OrderStrategyService:
             contract: Selected option contract
             strategy: Order execution strategy
             quantity: Order quantity (uses signal quantity if not specified)
+            now_iso: Creation timestamp to stamp on the order (defaults to now)
             
         Returns:
-            Order parameters dictionary or None if order cannot be created
+            Order parameters or None if order cannot be created
         """
         
         try:
@@ -84,36 +213,39 @@ class OrderStrategyService:
                 self.logger.error("Invalid order quantity")
                 return None
             
-            # Calculate order price based on strategy
-            order_price = self._calculate_order_price(contract, strategy, signal.action)
-            
-            if order_price is None and strategy != OrderStrategy.MARKET:
-                self.logger.error(f"Could not calculate price for strategy: {strategy.value}")
-                return None
+            # Calculate order price based on strategy; market orders don't need one
+            if strategy is OrderStrategy.MARKET:
+                order_price = None
+            else:
+                order_price = _from_ticks(self._calculate_order_price(contract, strategy, signal.action))
+                
+                if order_price is None:
+                    self.logger.error(f"Could not calculate price for strategy: {strategy.value}")
+                    return None
             
             # Determine order type
             order_type = self._get_order_type(strategy)
             
             # Create order parameters
-            order_params = {
-                "symbol": contract.symbol,
-                "order_type": order_type,
-                "side": signal.action,
-                "quantity": order_quantity,
-                "price": order_price,
-                "time_in_force": signal.time_in_force or "day",
-                "strategy": strategy.value,
-                "signal_id": signal.signal_id,
-                "created_at": datetime.now().isoformat()
-            }
+            order_params = OrderParams(
+                symbol=contract.symbol,
+                order_type=order_type,
+                side=signal.action,
+                quantity=order_quantity,
+                price=order_price,
+                time_in_force=signal.time_in_force or "day",
+                strategy=strategy.value,
+                signal_id=signal.signal_id,
+                created_at=now_iso or datetime.now().isoformat()
+            )
             
             # Add strategy-specific parameters
-            if strategy == OrderStrategy.STOP_LOSS:
-                order_params["stop_price"] = self._calculate_stop_price(contract, signal.action)
+            if strategy is OrderStrategy.STOP_LOSS:
+                order_params.stop_price = _from_ticks(self._calculate_stop_price(contract, signal.action))
             
             self.logger.info(
-                f"Created {strategy.value} order: {contract.symbol} "
-                f"{signal.action.value} {order_quantity} @ {order_price}"
+                "Created %s order: %s %s %s @ %s",
+                strategy.value, contract.symbol, signal.action, order_quantity, order_price
             )
             
             return order_params
@@ -122,154 +254,152 @@ class OrderStrategyService:
             self.logger.error(f"Error creating order: {e}")
             return None
     
+    def create_orders_batch(
+        self,
+        signals: List[TradeSignal],
+        contracts: List[OptionContract],
+        strategy: OrderStrategy = OrderStrategy.LIMIT_MIDPOINT
+    ) -> List[Optional[OrderParams]]:
+        """
+        Create orders for a batch of signals paired with their contracts
+        
+        Args:
+            signals: Trading signals
+            contracts: Selected option contract for each signal, in the same order
+            strategy: Order execution strategy applied to every order
+            
+        Returns:
+            Order parameters for each pair, None where an order cannot be created
+            
+        Raises:
+            ValueError: If signals and contracts differ in length
+        """
+        
+        if len(signals) != len(contracts):
+            raise ValueError(
+                f"Got {len(signals)} signals but {len(contracts)} contracts"
+            )
+        
+        # The whole batch shares one creation timestamp
+        now_iso = datetime.now().isoformat()
+        create_order = self.create_order
+        
+        return [
+            create_order(signal, contract, strategy, now_iso=now_iso)
+            for signal, contract in zip(signals, contracts)
+        ]
+    
     def _calculate_order_price(
         self,
         contract: OptionContract,
         strategy: OrderStrategy,
         side: OrderSide
-    ) -> Optional[Decimal]:
-        """Calculate order price based on strategy and market data"""
+    ) -> Optional[int]:
+        """Calculate order price in ticks based on strategy and market data"""
         
-        if strategy == OrderStrategy.MARKET:
+        if strategy is OrderStrategy.MARKET:
             return None  # Market orders don't need price
         
-        try:
-            if strategy == OrderStrategy.LIMIT:
-                # Use signal price if available, otherwise midpoint
-                return self._get_price_by_method(contract, PriceCalculationMethod.BID_ASK_MIDPOINT)
-            
-            elif strategy == OrderStrategy.LIMIT_MIDPOINT:
-                return self._get_price_by_method(contract, PriceCalculationMethod.BID_ASK_MIDPOINT)
-            
-            elif strategy == OrderStrategy.LIMIT_AGGRESSIVE:
-                # For buy orders, use ask price (or close to it)
-                # For sell orders, use bid price (or close to it)
-                if side == OrderSide.BUY:
-                    ask_price = self._get_price_by_method(contract, PriceCalculationMethod.ASK_PRICE)
-                    if ask_price:
-                        return ask_price * Decimal("0.99")  # Slightly below ask
-                else:
-                    bid_price = self._get_price_by_method(contract, PriceCalculationMethod.BID_PRICE)
-                    if bid_price:
-                        return bid_price * Decimal("1.01")  # Slightly above bid
-                
-                # Fallback to midpoint
-                return self._get_price_by_method(contract, PriceCalculationMethod.BID_ASK_MIDPOINT)
-            
-            elif strategy == OrderStrategy.LIMIT_CONSERVATIVE:
-                # For buy orders, use bid price (or below)
-                # For sell orders, use ask price (or above)
-                if side == OrderSide.BUY:
-                    bid_price = self._get_price_by_method(contract, PriceCalculationMethod.BID_PRICE)
-                    if bid_price:
-                        return bid_price * Decimal("1.01")  # Slightly above bid
-                else:
-                    ask_price = self._get_price_by_method(contract, PriceCalculationMethod.ASK_PRICE)
-                    if ask_price:
-                        return ask_price * Decimal("0.99")  # Slightly below ask
-                
-                # Fallback to midpoint
-                return self._get_price_by_method(contract, PriceCalculationMethod.BID_ASK_MIDPOINT)
-            
-            else:
-                # Default to midpoint
-                return self._get_price_by_method(contract, PriceCalculationMethod.BID_ASK_MIDPOINT)
-                
-        except Exception as e:
-            self.logger.error(f"Error calculating order price: {e}")
-            return None
+        # Strategies without a rule (LIMIT, LIMIT_MIDPOINT, ...) price at the midpoint
+        method, offset = _PRICE_RULES.get(
+            (strategy, side == OrderSide.BUY),
+            (PriceCalculationMethod.BID_ASK_MIDPOINT, 0)
+        )
+        price = self._get_price_by_method(contract, method)
+        if price and offset:
+            return _offset_ticks(price, offset)
+        return price
     
     def _get_price_by_method(
         self,
         contract: OptionContract,
         method: PriceCalculationMethod
-    ) -> Optional[Decimal]:
-        """Get price using specified calculation method"""
+    ) -> Optional[int]:
+        """Get price in ticks using specified calculation method"""
         
-        try:
-            if method == PriceCalculationMethod.BID_ASK_MIDPOINT:
-                if contract.bid and contract.ask:
-                    return (contract.bid + contract.ask) / 2
-            
-            elif method == PriceCalculationMethod.LAST_PRICE:
-                if contract.last_price:
-                    return contract.last_price
-            
-            elif method == PriceCalculationMethod.BID_PRICE:
-                if contract.bid:
-                    return contract.bid
-            
-            elif method == PriceCalculationMethod.ASK_PRICE:
-                if contract.ask:
-                    return contract.ask
-            
-            elif method == PriceCalculationMethod.THEORETICAL_PRICE:
-                # Use theoretical value if available, otherwise midpoint
-                if hasattr(contract, 'theoretical_price') and contract.theoretical_price:
-                    return contract.theoretical_price
-                elif contract.bid and contract.ask:
-                    return (contract.bid + contract.ask) / 2
-            
-            # Fallback chain: last -> midpoint -> bid -> ask
-            if contract.last_price:
-                return contract.last_price
-            elif contract.bid and contract.ask:
-                return (contract.bid + contract.ask) / 2
-            elif contract.bid:
-                return contract.bid
-            elif contract.ask:
-                return contract.ask
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error getting price by method {method.value}: {e}")
-            return None
+        fn = self._price_fns.get(method)
+        price = fn(contract) if fn else None
+        if price:
+            return price
+        
+        # Fallback chain: last -> midpoint -> bid -> ask, reading each field once
+        bid, ask, last = contract.bid, contract.ask, contract.last
+        if last:
+            return _to_ticks(last)
+        if bid and ask:
+            return _div_round(_to_ticks(bid) + _to_ticks(ask), 2)
+        if bid:
+            return _to_ticks(bid)
+        if ask:
+            return _to_ticks(ask)
+        return None
+    
+    @staticmethod
+    def _midpoint_ticks(contract: OptionContract) -> Optional[int]:
+        """Bid-ask midpoint in ticks"""
+        bid, ask = contract.bid, contract.ask
+        if bid and ask:
+            return _div_round(_to_ticks(bid) + _to_ticks(ask), 2)
+        return None
+    
+    @staticmethod
+    def _last_ticks(contract: OptionContract) -> Optional[int]:
+        """Last price in ticks"""
+        return _to_ticks(contract.last) if contract.last else None
+    
+    @staticmethod
+    def _bid_ticks(contract: OptionContract) -> Optional[int]:
+        """Bid price in ticks"""
+        return _to_ticks(contract.bid) if contract.bid else None
+    
+    @staticmethod
+    def _ask_ticks(contract: OptionContract) -> Optional[int]:
+        """Ask price in ticks"""
+        return _to_ticks(contract.ask) if contract.ask else None
+    
+    @classmethod
+    def _theoretical_ticks(cls, contract: OptionContract) -> Optional[int]:
+        """Theoretical value in ticks if available, otherwise midpoint"""
+        theoretical_price = getattr(contract, 'theoretical_price', None)
+        if theoretical_price:
+            return _to_ticks(theoretical_price)
+        return cls._midpoint_ticks(contract)
     
     def _get_order_type(self, strategy: OrderStrategy) -> OrderType:
         """Get order type based on strategy"""
         
-        if strategy == OrderStrategy.MARKET:
-            return OrderType.MARKET
-        elif strategy == OrderStrategy.STOP_LOSS:
-            return OrderType.STOP
-        else:
-            return OrderType.LIMIT
+        return _STRATEGY_ORDER_TYPES.get(strategy, OrderType.LIMIT)
     
     def _calculate_stop_price(
         self,
         contract: OptionContract,
         side: OrderSide,
-        stop_percentage: Decimal = Decimal("0.10")
-    ) -> Optional[Decimal]:
-        """Calculate stop price for stop loss orders"""
+        stop_percentage: Decimal = _D_010
+    ) -> Optional[int]:
+        """Calculate stop price in ticks for stop loss orders"""
         
-        try:
-            current_price = self._get_price_by_method(
-                contract, PriceCalculationMethod.BID_ASK_MIDPOINT
-            )
-            
-            if not current_price:
-                return None
-            
-            if side == OrderSide.BUY:
-                # For buy orders, stop below current price
-                return current_price * (1 - stop_percentage)
-            else:
-                # For sell orders, stop above current price
-                return current_price * (1 + stop_percentage)
-                
-        except Exception as e:
-            self.logger.error(f"Error calculating stop price: {e}")
+        current_price = self._get_price_by_method(
+            contract, PriceCalculationMethod.BID_ASK_MIDPOINT
+        )
+        
+        if not current_price:
             return None
+        
+        stop_ticks = _to_ticks(stop_percentage)
+        if side == OrderSide.BUY:
+            # For buy orders, stop below current price
+            return _offset_ticks(current_price, -stop_ticks)
+        else:
+            # For sell orders, stop above current price
+            return _offset_ticks(current_price, stop_ticks)
     
     def create_bracket_order(
         self,
         signal: TradeSignal,
         contract: OptionContract,
-        profit_target_pct: Decimal = Decimal("0.20"),
-        stop_loss_pct: Decimal = Decimal("0.10")
-    ) -> Optional[List[Dict[str, Any]]]:
+        profit_target_pct: Decimal = _D_020,
+        stop_loss_pct: Decimal = _D_010
+    ) -> Optional[List[OrderParams]]:
         """
         Create a bracket order (entry + profit target + stop loss)
         
@@ -284,58 +414,75 @@ class OrderStrategyService:
         """
         
         try:
-            # Create entry order
-            entry_order = self.create_order(
-                signal, contract, OrderStrategy.LIMIT_MIDPOINT
-            )
-            
-            if not entry_order:
+            quantity = signal.quantity
+            if not quantity or quantity <= 0:
+                self.logger.error("Invalid order quantity")
                 return None
             
-            entry_price = entry_order.get("price")
-            if not entry_price:
+            # Price all three legs up front, in ticks
+            is_buy = signal.action == OrderSide.BUY
+            entry_ticks = self._calculate_order_price(
+                contract, OrderStrategy.LIMIT_MIDPOINT, signal.action
+            )
+            if not entry_ticks:
                 return None
             
-            orders = [entry_order]
-            
-            # Create profit target order (opposite side)
-            profit_side = OrderSide.SELL if signal.action == OrderSide.BUY else OrderSide.BUY
-            profit_price = entry_price * (1 + profit_target_pct) if signal.action == OrderSide.BUY else entry_price * (1 - profit_target_pct)
-            
-            profit_order = {
-                "symbol": contract.symbol,
-                "order_type": OrderType.LIMIT,
-                "side": profit_side,
-                "quantity": signal.quantity,
-                "price": profit_price,
-                "time_in_force": "gtc",  # Good till cancelled
-                "strategy": "bracket_profit",
-                "signal_id": signal.signal_id,
-                "parent_order": "entry",
-                "created_at": datetime.now().isoformat()
-            }
-            orders.append(profit_order)
-            
-            # Create stop loss order
-            stop_price = entry_price * (1 - stop_loss_pct) if signal.action == OrderSide.BUY else entry_price * (1 + stop_loss_pct)
-            
-            stop_order = {
-                "symbol": contract.symbol,
-                "order_type": OrderType.STOP,
-                "side": profit_side,  # Same side as profit target
-                "quantity": signal.quantity,
-                "stop_price": stop_price,
-                "time_in_force": "gtc",
-                "strategy": "bracket_stop",
-                "signal_id": signal.signal_id,
-                "parent_order": "entry",
-                "created_at": datetime.now().isoformat()
-            }
-            orders.append(stop_order)
+            profit_offset = _to_ticks(profit_target_pct)
+            stop_offset = _to_ticks(stop_loss_pct)
+            entry_price = _from_ticks(entry_ticks)
+            profit_price = _from_ticks(_offset_ticks(entry_ticks, profit_offset if is_buy else -profit_offset))
+            stop_price = _from_ticks(_offset_ticks(entry_ticks, -stop_offset if is_buy else stop_offset))
+            
+            # Fields shared by every leg; all legs carry one creation timestamp
+            symbol = contract.symbol
+            signal_id = signal.signal_id
+            now_iso = datetime.now().isoformat()
+            
+            # Profit target and stop loss sit on the opposite side of the entry
+            exit_side = OrderSide.SELL if is_buy else OrderSide.BUY
+            
+            orders = [
+                OrderParams(
+                    symbol=symbol,
+                    order_type=OrderType.LIMIT,
+                    side=signal.action,
+                    quantity=quantity,
+                    price=entry_price,
+                    time_in_force=signal.time_in_force or "day",
+                    strategy=OrderStrategy.LIMIT_MIDPOINT.value,
+                    signal_id=signal_id,
+                    created_at=now_iso
+                ),
+                OrderParams(
+                    symbol=symbol,
+                    order_type=OrderType.LIMIT,
+                    side=exit_side,
+                    quantity=quantity,
+                    price=profit_price,
+                    time_in_force="gtc",  # Good till cancelled
+                    strategy="bracket_profit",
+                    signal_id=signal_id,
+                    created_at=now_iso,
+                    parent_order="entry"
+                ),
+                OrderParams(
+                    symbol=symbol,
+                    order_type=OrderType.STOP,
+                    side=exit_side,
+                    quantity=quantity,
+                    price=None,
+                    time_in_force="gtc",
+                    strategy="bracket_stop",
+                    signal_id=signal_id,
+                    created_at=now_iso,
+                    stop_price=stop_price,
+                    parent_order="entry"
+                ),
+            ]
             
             self.logger.info(
-                f"Created bracket order: entry @ {entry_price}, "
-                f"profit @ {profit_price}, stop @ {stop_price}"
+                "Created bracket order: entry @ %s, profit @ %s, stop @ %s",
+                entry_price, profit_price, stop_price
             )
             
             return orders
@@ -344,7 +491,7 @@ class OrderStrategyService:
             self.logger.error(f"Error creating bracket order: {e}")
             return None
     
-    def validate_order_parameters(self, order_params: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def validate_order_parameters(self, order_params: OrderParams) -> Tuple[bool, List[str]]:
         """
         Validate order parameters
         
@@ -355,44 +502,43 @@ class OrderStrategyService:
         errors = []
         
         # Required fields
-        required_fields = ["symbol", "order_type", "side", "quantity"]
-        for field in required_fields:
-            if field not in order_params or order_params[field] is None:
-                errors.append(f"Missing required field: {field}")
+        for field, message in _ERR_MISSING_FIELD.items():
+            if getattr(order_params, field) is None:
+                errors.append(message)
         
         # Validate quantity
-        if "quantity" in order_params:
+        if order_params.quantity is not None:
             try:
-                quantity = Decimal(str(order_params["quantity"]))
+                quantity = _as_decimal(order_params.quantity)
                 if quantity <= 0:
-                    errors.append("Quantity must be positive")
+                    errors.append(_ERR_QTY_POSITIVE)
                 elif quantity > self.account_config.max_position_size:
-                    errors.append(f"Quantity exceeds max position size: {self.account_config.max_position_size}")
-            except (ValueError, TypeError):
-                errors.append("Invalid quantity format")
+                    errors.append(self._max_size_error)
+            except (ValueError, TypeError, InvalidOperation):
+                errors.append(_ERR_QTY_FORMAT)
         
         # Validate price for limit orders
-        if order_params.get("order_type") == OrderType.LIMIT:
-            if "price" not in order_params or order_params["price"] is None:
-                errors.append("Price required for limit orders")
+        if order_params.order_type is OrderType.LIMIT:
+            if order_params.price is None:
+                errors.append(_ERR_PRICE_REQUIRED)
             else:
                 try:
-                    price = Decimal(str(order_params["price"]))
+                    price = _as_decimal(order_params.price)
                     if price <= 0:
-                        errors.append("Price must be positive")
-                except (ValueError, TypeError):
-                    errors.append("Invalid price format")
+                        errors.append(_ERR_PRICE_POSITIVE)
+                except (ValueError, TypeError, InvalidOperation):
+                    errors.append(_ERR_PRICE_FORMAT)
         
         # Validate stop price for stop orders
-        if order_params.get("order_type") == OrderType.STOP:
-            if "stop_price" not in order_params or order_params["stop_price"] is None:
-                errors.append("Stop price required for stop orders")
+        if order_params.order_type is OrderType.STOP:
+            if order_params.stop_price is None:
+                errors.append(_ERR_STOP_REQUIRED)
             else:
                 try:
-                    stop_price = Decimal(str(order_params["stop_price"]))
+                    stop_price = _as_decimal(order_params.stop_price)
                     if stop_price <= 0:
-                        errors.append("Stop price must be positive")
-                except (ValueError, TypeError):
-                    errors.append("Invalid stop price format")
+                        errors.append(_ERR_STOP_POSITIVE)
+                except (ValueError, TypeError, InvalidOperation):
+                    errors.append(_ERR_STOP_FORMAT)
         
         return len(errors) == 0, errors
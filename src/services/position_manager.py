@@ -6,11 +6,14 @@ for options trading portfolios.
 """
 
 import logging
+import re
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from decimal import Decimal
 from enum import Enum
 from collections import defaultdict
+from functools import lru_cache
 
 from ..models import (
     Position,
@@ -19,11 +22,62 @@ from ..models import (
     OrderSide,
     OptionType
 )
+from ..models.tiger import OCC_SYMBOL_RE
 from ..config import AccountConfig
 
 
 logger = logging.getLogger(__name__)
 
+_UNDERLYING_RE = re.compile(r'^([A-Z]+)')
+
+# Width of a position value row: (market_value, unrealized_pnl, realized_pnl,
+# delta, gamma, theta, vega)
+_VALUE_FIELDS = 7
+_ZERO_VALUES = (0.0,) * _VALUE_FIELDS
+
+# Decimal places kept on float-derived position sizes
+_SIZING_DECIMALS = 6
+
+
+def _position_values(position: Position) -> Tuple[float, ...]:
+    """Coerce one position's numeric fields to a float row, None -> 0"""
+    return (
+        float(position.market_value or 0),
+        float(position.unrealized_pnl or 0),
+        float(position.realized_pnl or 0),
+        # Greeks (if available)
+        float(getattr(position, 'delta', 0) or 0),
+        float(getattr(position, 'gamma', 0) or 0),
+        float(getattr(position, 'theta', 0) or 0),
+        float(getattr(position, 'vega', 0) or 0),
+    )
+
+
+@lru_cache(maxsize=8192)
+def _option_expiry_ts(symbol: str) -> Optional[float]:
+    """Expiry of an OCC-style option symbol as epoch seconds, None if not an option"""
+    match = OCC_SYMBOL_RE.fullmatch(symbol)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(2), '%y%m%d').timestamp()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _symbol_type_bits(symbol: str) -> int:
+    """Option/call bits of a symbol for indexing _TYPE_TABLE"""
+    match = OCC_SYMBOL_RE.fullmatch(symbol)
+    if not match:
+        return 0
+    return _TYPE_OPTION | (_TYPE_CALL if match.group(3) == 'C' else 0)
+
+
+def _sum_value_rows(rows: List[Tuple[float, ...]]) -> Tuple[float, ...]:
+    """Column-wise sum of value rows"""
+    return tuple(map(sum, zip(*rows))) or _ZERO_VALUES
+
 
 class PositionStatus(Enum):
     """Position status types"""
@@ -44,6 +98,26 @@ class PositionType(Enum):
     STRANGLE = "strangle"
 
 
+# Position type by (is_option << 2) | (is_call << 1) | is_long
+_TYPE_OPTION = 4
+_TYPE_CALL = 2
+_TYPE_TABLE = (
+    "stock",
+    "stock",
+    "stock",
+    "stock",
+    PositionType.SHORT_PUT.value,
+    PositionType.LONG_PUT.value,
+    PositionType.SHORT_CALL.value,
+    PositionType.LONG_CALL.value,
+)
+
+
+def _type_index(position: Position) -> int:
+    """Index of a position's type in _TYPE_TABLE"""
+    return _symbol_type_bits(position.symbol) | position.is_long
+
+
 class PositionManager:
     """
     Position management service for options trading
@@ -52,6 +126,23 @@ class PositionManager:
     portfolio analysis functionality.
     """
     
+    __slots__ = (
+        "account_config",
+        "logger",
+        "_positions",
+        "_position_history",
+        "_by_underlying",
+        "_total_market_value",
+        "_total_unrealized_pnl",
+        "_total_realized_pnl",
+        "_per_underlying_mv",
+        "_max_underlying_mv",
+        "_expiries",
+        "_expiry_positions",
+        "_positions_version",
+        "_metrics_cache",
+    )
+    
     def __init__(self, account_config: AccountConfig):
         """Initialize position manager"""
         self.account_config = account_config
@@ -60,6 +151,23 @@ class PositionManager:
         # In-memory position tracking (in production, this would use database)
         self._positions: Dict[str, Position] = {}
         self._position_history: List[Dict[str, Any]] = []
+        self._by_underlying: Dict[str, List[Position]] = {}
+        
+        # Book-level totals, recomputed in update_positions
+        self._total_market_value = 0.0
+        self._total_unrealized_pnl = 0.0
+        self._total_realized_pnl = 0.0
+        self._per_underlying_mv: Dict[str, float] = {}
+        self._max_underlying_mv = 0.0
+        
+        # Option positions sorted by expiry, with expiries as a parallel list
+        # of epoch seconds for bisecting
+        self._expiries: List[float] = []
+        self._expiry_positions: List[Position] = []
+        
+        # Bumped on every update so cached metrics know when they are stale
+        self._positions_version = 0
+        self._metrics_cache: Optional[Tuple[int, Dict[str, Any]]] = None
     
     def update_positions(self, positions: List[Position]) -> None:
         """
@@ -72,25 +180,53 @@ class PositionManager:
         try:
             # Clear existing positions
             self._positions.clear()
+            self._by_underlying.clear()
             
             # Add new positions
             for position in positions:
                 if position.symbol:
                     self._positions[position.symbol] = position
             
+            # Index by underlying, accumulate totals and parse option expiries
+            # once so lookups don't rescan the book
+            total_market_value = 0.0
+            total_unrealized_pnl = 0.0
+            total_realized_pnl = 0.0
+            per_underlying_mv = defaultdict(float)
+            dated = []
+            for position in self._positions.values():
+                underlying = self._extract_underlying(position.symbol)
+                self._by_underlying.setdefault(underlying, []).append(position)
+                
+                market_value = float(position.market_value or 0)
+                total_market_value += market_value
+                total_unrealized_pnl += float(position.unrealized_pnl or 0)
+                total_realized_pnl += float(position.realized_pnl or 0)
+                per_underlying_mv[underlying] += market_value
+                
+                expiry = _option_expiry_ts(position.symbol)
+                if expiry is not None:
+                    dated.append((expiry, position))
+            
+            dated.sort(key=lambda item: item[0])
+            self._expiries = [expiry for expiry, _ in dated]
+            self._expiry_positions = [position for _, position in dated]
+            
+            self._total_market_value = total_market_value
+            self._total_unrealized_pnl = total_unrealized_pnl
+            self._total_realized_pnl = total_realized_pnl
+            self._per_underlying_mv = dict(per_underlying_mv)
+            # Taken over final sums: short legs can lower an underlying's value
+            self._max_underlying_mv = max(per_underlying_mv.values(), default=0.0)
+            
+            self._positions_version += 1
+            
             self.logger.info(f"Updated {len(positions)} positions")
             
             # Log position summary
-            total_value = sum(
-                float(pos.market_value or 0) for pos in positions
-            )
-            total_pnl = sum(
-                float(pos.unrealized_pnl or 0) for pos in positions
-            )
-            
             self.logger.info(
-                f"Portfolio summary: ${total_value:.2f} value, "
-                f"${total_pnl:.2f} unrealized P&L"
+                f"Portfolio summary: ${total_market_value:.2f} value, "
+                f"${total_unrealized_pnl:.2f} unrealized P&L"
             )
             
         except Exception as e:
@@ -107,21 +243,40 @@ class PositionManager:
     def get_positions_by_underlying(self, underlying: str) -> List[Position]:
         """Get all positions for a specific underlying asset"""
         
-        positions = []
-        for position in self._positions.values():
-            # Extract underlying from option symbol
-            if self._extract_underlying(position.symbol) == underlying.upper():
-                positions.append(position)
-        
-        return positions
+        return list(self._by_underlying.get(underlying.upper(), ()))
     
     def calculate_portfolio_metrics(self) -> Dict[str, Any]:
-        """Calculate comprehensive portfolio metrics"""
+        """
+        Calculate comprehensive portfolio metrics
+        
+        Results are cached until the next update_positions call; each call
+        gets its own copy with a fresh calculated_at.
+        """
+        
+        cached = self._metrics_cache
+        if cached is None or cached[0] != self._positions_version:
+            metrics = self._compute_portfolio_metrics()
+            if not metrics:
+                return {}
+            cached = self._metrics_cache = (self._positions_version, metrics)
+        
+        metrics = dict(cached[1])
+        metrics["by_underlying"] = {
+            underlying: dict(entry) for underlying, entry in metrics["by_underlying"].items()
+        }
+        metrics["by_position_type"] = {
+            name: dict(entry) for name, entry in metrics["by_position_type"].items()
+        }
+        metrics["risk_metrics"] = dict(metrics["risk_metrics"])
+        if "calculated_at" in metrics:
+            metrics["calculated_at"] = datetime.now().isoformat()
+        return metrics
+    
+    def _compute_portfolio_metrics(self) -> Dict[str, Any]:
+        """Build the portfolio metrics that calculate_portfolio_metrics caches"""
         
         try:
-            positions = list(self._positions.values())
-            
-            if not positions:
+            if not self._positions:
                 return {
                     "total_positions": 0,
                     "total_market_value": 0.0,
@@ -136,59 +291,70 @@ class PositionManager:
                     "risk_metrics": {}
                 }
             
-            # Basic metrics
-            total_market_value = sum(float(pos.market_value or 0) for pos in positions)
-            total_unrealized_pnl = sum(float(pos.unrealized_pnl or 0) for pos in positions)
-            total_realized_pnl = sum(float(pos.realized_pnl or 0) for pos in positions)
-            
-            # Greeks (if available)
-            portfolio_delta = sum(float(getattr(pos, 'delta', 0) or 0) for pos in positions)
-            portfolio_gamma = sum(float(getattr(pos, 'gamma', 0) or 0) for pos in positions)
-            portfolio_theta = sum(float(getattr(pos, 'theta', 0) or 0) for pos in positions)
-            portfolio_vega = sum(float(getattr(pos, 'vega', 0) or 0) for pos in positions)
-            
-            # Group by underlying
-            by_underlying = defaultdict(lambda: {
-                'positions': 0,
-                'market_value': 0.0,
-                'unrealized_pnl': 0.0,
-                'delta': 0.0
-            })
-            
-            for pos in positions:
-                underlying = self._extract_underlying(pos.symbol)
-                by_underlying[underlying]['positions'] += 1
-                by_underlying[underlying]['market_value'] += float(pos.market_value or 0)
-                by_underlying[underlying]['unrealized_pnl'] += float(pos.unrealized_pnl or 0)
-                by_underlying[underlying]['delta'] += float(getattr(pos, 'delta', 0) or 0)
-            
-            # Group by position type
-            by_position_type = defaultdict(lambda: {
-                'positions': 0,
-                'market_value': 0.0,
-                'unrealized_pnl': 0.0
-            })
-            
-            for pos in positions:
-                pos_type = self._classify_position_type(pos)
-                by_position_type[pos_type]['positions'] += 1
-                by_position_type[pos_type]['market_value'] += float(pos.market_value or 0)
-                by_position_type[pos_type]['unrealized_pnl'] += float(pos.unrealized_pnl or 0)
+            # Reduce float rows per underlying, then reduce the group totals
+            by_underlying = {}
+            group_totals = []
+            
+            # Flat accumulators indexed like _TYPE_TABLE
+            type_counts = [0] * len(_TYPE_TABLE)
+            type_market_value = [0.0] * len(_TYPE_TABLE)
+            type_unrealized_pnl = [0.0] * len(_TYPE_TABLE)
+            
+            for underlying, group in self._by_underlying.items():
+                rows = [_position_values(pos) for pos in group]
+                totals = _sum_value_rows(rows)
+                group_totals.append(totals)
+                by_underlying[underlying] = {
+                    'positions': len(group),
+                    'market_value': totals[0],
+                    'unrealized_pnl': totals[1],
+                    'delta': totals[3]
+                }
+                
+                for pos, row in zip(group, rows):
+                    index = _type_index(pos)
+                    type_counts[index] += 1
+                    type_market_value[index] += row[0]
+                    type_unrealized_pnl[index] += row[1]
+            
+            # Long and short stock share a name, so fold slots by type name
+            by_position_type = {}
+            for name, count, market_value, unrealized_pnl in zip(
+                _TYPE_TABLE, type_counts, type_market_value, type_unrealized_pnl
+            ):
+                if not count:
+                    continue
+                type_entry = by_position_type.setdefault(name, {
+                    'positions': 0,
+                    'market_value': 0.0,
+                    'unrealized_pnl': 0.0
+                })
+                type_entry['positions'] += count
+                type_entry['market_value'] += market_value
+                type_entry['unrealized_pnl'] += unrealized_pnl
+            
+            # Market value and P&L totals were accumulated in update_positions
+            (
+                portfolio_delta,
+                portfolio_gamma,
+                portfolio_theta,
+                portfolio_vega
+            ) = _sum_value_rows(group_totals)[3:]
             
             # Risk metrics
-            risk_metrics = self._calculate_risk_metrics(positions)
+            risk_metrics = self._calculate_risk_metrics()
             
             return {
-                "total_positions": len(positions),
-                "total_market_value": total_market_value,
-                "total_unrealized_pnl": total_unrealized_pnl,
-                "total_realized_pnl": total_realized_pnl,
+                "total_positions": len(self._positions),
+                "total_market_value": self._total_market_value,
+                "total_unrealized_pnl": self._total_unrealized_pnl,
+                "total_realized_pnl": self._total_realized_pnl,
                 "portfolio_delta": portfolio_delta,
                 "portfolio_gamma": portfolio_gamma,
                 "portfolio_theta": portfolio_theta,
                 "portfolio_vega": portfolio_vega,
-                "by_underlying": dict(by_underlying),
-                "by_position_type": dict(by_position_type),
+                "by_underlying": by_underlying,
+                "by_position_type": by_position_type,
                 "risk_metrics": risk_metrics,
                 "calculated_at": datetime.now().isoformat()
             }
@@ -213,19 +379,18 @@ class PositionManager:
         
         try:
             # Check individual position size limit
-            current_position = self.get_position(symbol)
-            current_quantity = Decimal(str(current_position.quantity)) if current_position else Decimal('0')
-            new_total_quantity = abs(current_quantity + quantity)
+            current_position = self._positions.get(symbol)
+            current_quantity = float(current_position.quantity) if current_position else 0.0
+            new_total_quantity = abs(current_quantity + float(quantity))
             
             if new_total_quantity > self.account_config.max_position_size:
                 violations.append(
-                    f"Position size limit exceeded: {new_total_quantity} > {self.account_config.max_position_size}"
+                    f"Position size limit exceeded: {new_total_quantity:g} > {self.account_config.max_position_size}"
                 )
             
             # Check underlying concentration limit
             underlying = self._extract_underlying(symbol)
-            underlying_positions = self.get_positions_by_underlying(underlying)
-            underlying_value = sum(float(pos.market_value or 0) for pos in underlying_positions)
+            underlying_value = self._per_underlying_mv.get(underlying, 0.0)
             
             # Assume max 50% concentration per underlying
             max_underlying_value = float(self.account_config.max_position_size) * 0.5
@@ -236,8 +401,7 @@ class PositionManager:
             
             # Check total portfolio value limit (if configured)
             if hasattr(self.account_config, 'max_portfolio_value'):
-                metrics = self.calculate_portfolio_metrics()
-                total_value = metrics.get('total_market_value', 0)
+                total_value = self._total_market_value
                 if total_value > float(self.account_config.max_portfolio_value):
                     violations.append(
                         f"Portfolio value limit exceeded: ${total_value:.2f} > ${self.account_config.max_portfolio_value}"
@@ -268,37 +432,45 @@ class PositionManager:
         """
         
         try:
-            # Start with signal quantity
+            # Size in floats; suggested_quantity keeps the winning limit as given
+            # so the result converts to Decimal exactly once
+            quantity = float(signal_quantity)
             suggested_quantity = signal_quantity
             
             # Apply account-level limits
-            max_account_size = Decimal(str(self.account_config.max_position_size))
-            suggested_quantity = min(suggested_quantity, max_account_size)
+            max_account_size = self.account_config.max_position_size
+            if quantity > max_account_size:
+                quantity = suggested_quantity = max_account_size
             
             # Apply default position size if signal quantity is too large
-            default_size = Decimal(str(self.account_config.default_position_size))
-            if suggested_quantity > default_size * 2:
-                suggested_quantity = default_size
+            default_size = self.account_config.default_position_size
+            if quantity > default_size * 2:
+                quantity = suggested_quantity = default_size
             
             # Apply risk-based sizing (simplified)
-            metrics = self.calculate_portfolio_metrics()
-            portfolio_value = metrics.get('total_market_value', 0)
+            portfolio_value = self._total_market_value
             
             if portfolio_value > 0:
-                max_risk_value = Decimal(str(portfolio_value)) * risk_percentage
+                max_risk_value = portfolio_value * float(risk_percentage)
                 # Assume 10% of position value as risk (simplified)
                 max_position_value = max_risk_value * 10
                 
                 # This would need actual option pricing to be accurate
                 # For now, use a simple heuristic
-                estimated_option_price = Decimal('5.00')  # $5 per contract
+                estimated_option_price = 5.0  # $5 per contract
                 max_contracts = max_position_value / estimated_option_price
                 
-                suggested_quantity = min(suggested_quantity, max_contracts)
+                if max_contracts < quantity:
+                    quantity = max_contracts
+                    # Round away binary noise (e.g. 14.062000000000001) before
+                    # it reaches the Decimal result
+                    suggested_quantity = round(max_contracts, _SIZING_DECIMALS)
             
             # Ensure minimum viable quantity
-            min_quantity = Decimal('1')
-            suggested_quantity = max(suggested_quantity, min_quantity)
+            if quantity < 1:
+                suggested_quantity = 1
+            
+            suggested_quantity = Decimal(str(suggested_quantity))
             
             self.logger.info(
                 f"Position sizing for {symbol}: requested {signal_quantity}, "
@@ -311,108 +483,50 @@ class PositionManager:
             self.logger.error(f"Error suggesting position size: {e}")
             return signal_quantity
     
-    def _extract_underlying(self, option_symbol: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _extract_underlying(option_symbol: str) -> str:
         """Extract underlying symbol from option symbol"""
         
-        try:
-            # Handle different option symbol formats
-            # Example: "AAPL  250117C00150000" -> "AAPL"
-            if '  ' in option_symbol:
-                return option_symbol.split('  ')[0].strip()
-            
-            # Fallback: assume first part before space or number
-            import re
-            match = re.match(r'^([A-Z]+)', option_symbol)
-            if match:
-                return match.group(1)
-            
-            return option_symbol
-            
-        except Exception:
-            return option_symbol
+        # Handle different option symbol formats
+        # Example: "AAPL  250117C00150000" -> "AAPL"
+        head, sep, _ = option_symbol.partition('  ')
+        if sep:
+            return head.strip()
+        
+        # Fallback: assume first part before space or number
+        match = _UNDERLYING_RE.match(option_symbol)
+        return match.group(1) if match else option_symbol
     
     def _classify_position_type(self, position: Position) -> str:
         """Classify position type based on symbol and quantity"""
-        
-        try:
-            # Determine if it's an option
-            if self._is_option_symbol(position.symbol):
-                # Determine call/put from symbol
-                is_call = 'C' in position.symbol
-                is_long = float(position.quantity or 0) > 0
-                
-                if is_call and is_long:
-                    return PositionType.LONG_CALL.value
-                elif is_call and not is_long:
-                    return PositionType.SHORT_CALL.value
-                elif not is_call and is_long:
-                    return PositionType.LONG_PUT.value
-                else:
-                    return PositionType.SHORT_PUT.value
-            else:
-                return "stock"
-                
-        except Exception:
-            return "unknown"
+        return _TYPE_TABLE[_type_index(position)]
     
     def _is_option_symbol(self, symbol: str) -> bool:
-        """Check if symbol is an option"""
-        
-        # Simple heuristic: options typically have spaces and C/P indicators
-        return '  ' in symbol and ('C' in symbol or 'P' in symbol)
+        """Check if symbol is an OCC-style option symbol"""
+        return bool(_symbol_type_bits(symbol) & _TYPE_OPTION)
     
-    def _calculate_risk_metrics(self, positions: List[Position]) -> Dict[str, Any]:
-        """Calculate portfolio risk metrics"""
+    def _calculate_risk_metrics(self) -> Dict[str, Any]:
+        """Calculate portfolio risk metrics from the totals kept by update_positions"""
         
-        try:
-            if not positions:
-                return {}
-            
-            # Calculate basic risk metrics
-            total_value = sum(float(pos.market_value or 0) for pos in positions)
-            total_pnl = sum(float(pos.unrealized_pnl or 0) for pos in positions)
-            
-            # Value at Risk (simplified)
-            var_1d = total_value * 0.02  # Assume 2% daily VaR
-            
+        if not self._positions:
+            return {}
+        
+        total_value = self._total_market_value
+        
+        return {
+            # Value at Risk (simplified): assume 2% daily VaR
+            "value_at_risk_1d": total_value * 0.02,
             # Maximum drawdown (would need historical data)
-            max_drawdown = abs(min(0, total_pnl))
-            
+            "max_drawdown": abs(min(0.0, self._total_unrealized_pnl)),
             # Concentration risk
-            underlying_values = defaultdict(float)
-            for pos in positions:
-                underlying = self._extract_underlying(pos.symbol)
-                underlying_values[underlying] += float(pos.market_value or 0)
-            
-            max_concentration = max(underlying_values.values()) / total_value if total_value > 0 else 0
-            
-            return {
-                "value_at_risk_1d": var_1d,
-                "max_drawdown": max_drawdown,
-                "max_concentration": max_concentration,
-                "position_count": len(positions),
-                "underlying_count": len(underlying_values)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating risk metrics: {e}")
-            return {}
+            "max_concentration": self._max_underlying_mv / total_value if total_value > 0 else 0,
+            "position_count": len(self._positions),
+            "underlying_count": len(self._per_underlying_mv)
+        }
     
     def get_expiring_positions(self, days_ahead: int = 7) -> List[Position]:
-        """Get positions expiring within specified days"""
-        
-        expiring = []
-        cutoff_date = datetime.now() + timedelta(days=days_ahead)
-        
-        for position in self._positions.values():
-            if self._is_option_symbol(position.symbol):
-                # Extract expiry from symbol (simplified)
-                # In practice, you'd need proper option symbol parsing
-                try:
-                    # This is a placeholder - real implementation would parse option symbols
-                    # to extract expiry dates
-                    expiring.append(position)
-                except Exception:
-                    continue
+        """Get option positions expiring within specified days, soonest first"""
         
-        return expiring
+        cutoff = (datetime.now() + timedelta(days=days_ahead)).timestamp()
+        return self._expiry_positions[:bisect_right(self._expiries, cutoff)]
@@ -389,7 +389,7 @@ class RiskManager:
         
         try:
             # Estimate trade value
-            price = contract.last_price or contract.ask or Decimal('5.00')
+            price = contract.last or contract.ask or Decimal('5.00')
             trade_value = price * quantity
             
             # Get portfolio metrics
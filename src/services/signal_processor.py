@@ -4,7 +4,7 @@ Signal processing service for handling validated trading signals
 
 import logging
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 
@@ -27,6 +27,10 @@ from .risk_manager import RiskManager, RiskCheckResult
 
 logger = logging.getLogger(__name__)
 
+# Fetch the chain for the first expiry at least this far out, matching the
+# option selector's default minimum days to expiration
+_CHAIN_MIN_DAYS_TO_EXPIRY = 7
+
 
 class SignalProcessingError(Exception):
     """Signal processing error"""
@@ -325,13 +329,13 @@ class SignalProcessor:
 
             # Step 6: Place order
             order_id = client.place_order(
-                symbol=order_params["symbol"],
-                order_type=OrderType(order_params["order_type"]),
-                side=OrderSide(order_params["side"]),
-                quantity=Decimal(str(order_params["quantity"])),
-                price=Decimal(str(order_params["price"])) if order_params.get("price") else None,
-                stop_price=Decimal(str(order_params["stop_price"])) if order_params.get("stop_price") else None,
-                time_in_force=order_params.get("time_in_force", "day")
+                symbol=order_params.symbol,
+                order_type=OrderType(order_params.order_type),
+                side=OrderSide(order_params.side),
+                quantity=Decimal(str(order_params.quantity)),
+                price=Decimal(str(order_params.price)) if order_params.price else None,
+                stop_price=Decimal(str(order_params.stop_price)) if order_params.stop_price else None,
+                time_in_force=order_params.time_in_force or "day"
             )
 
             if not order_id:
@@ -339,7 +343,7 @@ class SignalProcessor:
 
             # Update position manager
             services["position_manager"].update_position_after_order(
-                selected_contract.symbol, order_params["side"], suggested_quantity, order_id
+                selected_contract.symbol, order_params.side, suggested_quantity, order_id
             )
 
             return {
@@ -350,7 +354,7 @@ class SignalProcessor:
                 "action": trade_signal.action,
                 "selected_contract": selected_contract.symbol,
                 "quantity": float(suggested_quantity),
-                "order_price": float(order_params["price"]) if order_params.get("price") else None,
+                "order_price": float(order_params.price) if order_params.price else None,
                 "order_id": order_id,
                 "risk_result": risk_result.value,
                 "risk_messages": risk_messages,
@@ -533,41 +537,22 @@ class SignalProcessor:
 
         try:
             logger.info(f"Getting option chain for symbol: {symbol}")
-            # Get option chain from client
-            option_chain_data = client.get_option_chain(symbol)
-            logger.info(f"Received option chain data: {len(option_chain_data) if option_chain_data else 0} contracts")
 
-            if not option_chain_data:
-                logger.warning(f"No option chain data for symbol: {symbol}")
+            # get_option_expirations/get_option_chain are implemented by both
+            # the real and the mock client
+            expirations = client.get_option_expirations(symbol)
+            if not expirations:
+                logger.warning(f"No option expirations for symbol: {symbol}")
                 return []
 
-            # Convert to OptionContract objects
-            option_contracts = []
-            for contract_data in option_chain_data:
-                try:
-                    # Parse expiry date
-                    expiry_str = contract_data.get('expiry', '2025-01-17T00:00:00')
-                    if 'T' in expiry_str:
-                        expiry = datetime.fromisoformat(expiry_str.replace('T', ' ').replace('Z', ''))
-                    else:
-                        expiry = datetime.strptime(expiry_str, '%Y-%m-%d')
-
-                    contract = OptionContract(
-                        symbol=contract_data.get('symbol', ''),
-                        underlying=symbol,
-                        strike=Decimal(str(contract_data.get('strike', 0))),
-                        expiry=expiry,
-                        option_type=contract_data.get('option_type', 'call'),
-                        bid=Decimal(str(contract_data.get('bid', 0))),
-                        ask=Decimal(str(contract_data.get('ask', 0))),
-                        last_price=Decimal(str(contract_data.get('last_price', 0))),
-                        volume=contract_data.get('volume', 0),
-                        open_interest=contract_data.get('open_interest', 0)
-                    )
-                    option_contracts.append(contract)
-                except Exception as e:
-                    logger.warning(f"Failed to parse option contract: {e}")
-                    continue
+            cutoff = datetime.now() + timedelta(days=_CHAIN_MIN_DAYS_TO_EXPIRY)
+            expiry = next((e for e in expirations if e >= cutoff), expirations[-1])
+
+            option_contracts = client.get_option_chain(symbol, expiry)
+            logger.info(f"Received option chain data: {len(option_contracts)} contracts")
+
+            if not option_contracts:
+                logger.warning(f"No option chain data for symbol: {symbol}")
 
             return option_contracts
 
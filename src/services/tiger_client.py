@@ -50,6 +50,7 @@ from ..models import (
     Currency,
     OrderType,
     OrderSide,
+    OrderStatus,
     OptionType,
 )
 
@@ -363,6 +364,13 @@ class TigerClient:
                 if status and row.get('status') != status:
                     continue
 
+                order_status = self._convert_tiger_order_status(row.get('status', ''))
+                if order_status is None:
+                    logger.warning(
+                        f"Skipping order {row.get('orderId')} with unknown status: {row.get('status')}"
+                    )
+                    continue
+
                 order = TigerOrder(
                     order_id=str(row.get('orderId', '')),
                     account=self.account_config.account,
@@ -373,7 +381,7 @@ class TigerClient:
                     price=Decimal(str(row.get('limitPrice', 0))) if row.get('limitPrice') else None,
                     stop_price=Decimal(str(row.get('auxPrice', 0))) if row.get('auxPrice') else None,
                     time_in_force=row.get('timeInForce', 'day').lower(),
-                    status=self._convert_tiger_order_status(row.get('status', '')),
+                    status=order_status,
                     filled_quantity=Decimal(str(row.get('filledQuantity', 0))),
                     avg_fill_price=Decimal(str(row.get('avgFillPrice', 0))) if row.get('avgFillPrice') else None,
                     created_at=datetime.fromtimestamp(row.get('createTime', 0) / 1000) if row.get('createTime') else datetime.now(),
@@ -413,14 +421,14 @@ class TigerClient:
         }
         return mapping.get(tiger_order_type, OrderType.LIMIT)
 
-    def _convert_tiger_order_status(self, tiger_status: str) -> str:
-        """Convert Tiger order status to our standard status"""
+    def _convert_tiger_order_status(self, tiger_status: str) -> Optional[OrderStatus]:
+        """Convert Tiger order status to our OrderStatus enum, None if unknown"""
         mapping = {
-            "PendingSubmit": "pending",
-            "Submitted": "submitted",
-            "Filled": "filled",
-            "Cancelled": "cancelled",
-            "Rejected": "rejected",
-            "PartiallyFilled": "partial_filled",
+            "PendingSubmit": OrderStatus.PENDING,
+            "Submitted": OrderStatus.SUBMITTED,
+            "Filled": OrderStatus.FILLED,
+            "Cancelled": OrderStatus.CANCELLED,
+            "Rejected": OrderStatus.REJECTED,
+            "PartiallyFilled": OrderStatus.PARTIAL_FILLED,
         }
-        return mapping.get(tiger_status, "unknown")
+        return mapping.get(tiger_status)
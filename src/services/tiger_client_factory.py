@@ -3,6 +3,7 @@ Tiger client factory for creating appropriate client instances
 """
 
 import logging
+import threading
 from typing import Union, Dict, Optional
 
 from ..config import AccountConfig, get_settings
@@ -20,6 +21,7 @@ class TigerClientFactory:
     """Factory for creating Tiger client instances"""
     
     _clients: Dict[str, TigerClientType] = {}
+    _lock = threading.Lock()
     
     @classmethod
     def create_client(cls, account_config: AccountConfig) -> TigerClientType:
@@ -44,10 +46,15 @@ class TigerClientFactory:
         """Get or create a cached Tiger client instance"""
         account_name = account_config.name
         
-        if account_name not in cls._clients:
-            cls._clients[account_name] = cls.create_client(account_config)
+        client = cls._clients.get(account_name)
+        if client is None:
+            with cls._lock:
+                client = cls._clients.get(account_name)
+                if client is None:
+                    client = cls.create_client(account_config)
+                    cls._clients[account_name] = client
         
-        return cls._clients[account_name]
+        return client
     
     @classmethod
     def get_client_by_name(cls, account_name: str, account_configs: Dict[str, AccountConfig]) -> Optional[TigerClientType]:
@@ -66,14 +73,16 @@ class TigerClientFactory:
     @classmethod
     def clear_cache(cls):
         """Clear the client cache"""
-        cls._clients.clear()
+        with cls._lock:
+            cls._clients.clear()
         logger.info("Tiger client cache cleared")
     
     @classmethod
     def remove_client(cls, account_name: str):
         """Remove a specific client from cache"""
-        if account_name in cls._clients:
-            del cls._clients[account_name]
+        with cls._lock:
+            removed = cls._clients.pop(account_name, None)
+        if removed is not None:
             logger.info(f"Removed Tiger client from cache: {account_name}")
     
     @classmethod
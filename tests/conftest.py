@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the service tests
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.config import AccountConfig
+from src.models import OptionContract, TradeSignal
+
+
+@pytest.fixture
+def account_config() -> AccountConfig:
+    """Minimal account configuration; nothing here touches the Tiger SDK"""
+    return AccountConfig(
+        name="test",
+        description="Test account",
+        tiger_id="test_id",
+        private_key_path="config/test_private_key.pem",
+        account="TEST001",
+    )
+
+
+@pytest.fixture
+def make_contract():
+    """Build an option contract with the given quotes"""
+
+    def _make(bid=None, ask=None, last=None, symbol="AAPL  261218C00150000"):
+        return OptionContract(
+            symbol=symbol,
+            underlying_symbol="AAPL",
+            strike=Decimal("150"),
+            expiry=datetime(2026, 12, 18),
+            option_type="call",
+            bid=bid,
+            ask=ask,
+            last=last,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def make_signal():
+    """Build a trade signal for the given side"""
+
+    def _make(action="buy", quantity=Decimal("2"), signal_id="sig-1"):
+        return TradeSignal(
+            signal_id=signal_id,
+            account_name="test",
+            symbol="AAPL",
+            action=action,
+            quantity=quantity,
+            received_at=datetime.now(),
+        )
+
+    return _make
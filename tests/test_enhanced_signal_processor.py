@@ -0,0 +1,124 @@
+"""
+Tests for the option chain cache in EnhancedSignalProcessor
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.models import OptionContract
+from src.services import enhanced_signal_processor
+from src.services.enhanced_signal_processor import EnhancedSignalProcessor
+
+
+def _chain(symbol: str):
+    return [
+        OptionContract(
+            symbol=f"{symbol:<6}261218C00150000",
+            underlying_symbol=symbol,
+            strike=Decimal("150"),
+            expiry=datetime(2026, 12, 18),
+            option_type="call",
+        )
+    ]
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """Processor whose chain fetches are counted and can be held open"""
+    processor = EnhancedSignalProcessor(max_concurrency=1)
+    processor.fetch_calls = []
+    processor.release = None
+
+    async def fetch(symbol, services):
+        processor.fetch_calls.append(symbol)
+        if processor.release is not None:
+            await processor.release.wait()
+        return _chain(symbol)
+
+    monkeypatch.setattr(processor, "_fetch_option_chain", fetch)
+    return processor
+
+
+def test_chain_is_cached_within_ttl(processor):
+    async def scenario():
+        first = await processor._get_option_chain("AAPL", {})
+        second = await processor._get_option_chain("AAPL", {})
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is second
+    assert processor.fetch_calls == ["AAPL"]
+
+
+def test_chain_is_refetched_after_ttl(processor):
+    async def scenario():
+        await processor._get_option_chain("AAPL", {})
+        fetched_at, contracts = processor._chain_cache["AAPL"]
+        processor._chain_cache["AAPL"] = (
+            fetched_at - enhanced_signal_processor._CHAIN_TTL_SECONDS - 1,
+            contracts,
+        )
+        await processor._get_option_chain("AAPL", {})
+
+    asyncio.run(scenario())
+
+    assert processor.fetch_calls == ["AAPL", "AAPL"]
+    assert time.monotonic() - processor._chain_cache["AAPL"][0] < enhanced_signal_processor._CHAIN_TTL_SECONDS
+
+
+def test_concurrent_requests_share_one_fetch(processor):
+    async def scenario():
+        processor.release = asyncio.Event()
+        waiters = [asyncio.ensure_future(processor._get_option_chain("AAPL", {})) for _ in range(3)]
+        other = asyncio.ensure_future(processor._get_option_chain("MSFT", {}))
+        await asyncio.sleep(0)
+        assert set(processor._chain_inflight) == {"AAPL", "MSFT"}
+        processor.release.set()
+        return await asyncio.gather(*waiters), await other
+
+    results, other = asyncio.run(scenario())
+
+    assert sorted(processor.fetch_calls) == ["AAPL", "MSFT"]
+    assert results[0] is results[1] is results[2]
+    assert other[0].underlying_symbol == "MSFT"
+    assert processor._chain_inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_shared_fetch(processor):
+    async def scenario():
+        processor.release = asyncio.Event()
+        cancelled = asyncio.ensure_future(processor._get_option_chain("AAPL", {}))
+        survivor = asyncio.ensure_future(processor._get_option_chain("AAPL", {}))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        processor.release.set()
+        return await survivor
+
+    chain = asyncio.run(scenario())
+
+    assert chain[0].underlying_symbol == "AAPL"
+    assert processor.fetch_calls == ["AAPL"]
+    assert "AAPL" in processor._chain_cache
+
+
+def test_empty_chain_is_not_cached(processor, monkeypatch):
+    async def fetch_empty(symbol, services):
+        processor.fetch_calls.append(symbol)
+        return []
+
+    monkeypatch.setattr(processor, "_fetch_option_chain", fetch_empty)
+
+    async def scenario():
+        await processor._get_option_chain("AAPL", {})
+        await processor._get_option_chain("AAPL", {})
+
+    asyncio.run(scenario())
+
+    assert processor.fetch_calls == ["AAPL", "AAPL"]
+    assert "AAPL" not in processor._chain_cache
@@ -0,0 +1,61 @@
+"""
+Tests for MockTigerClient order bookkeeping
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.models import OrderSide, OrderStatus, OrderType
+from src.services.mock_tiger_client import MockTigerClient
+
+
+@pytest.fixture
+def client(account_config) -> MockTigerClient:
+    return MockTigerClient(account_config, seed=7)
+
+
+def _place_limit(client: MockTigerClient, symbol: str = "AAPL  261218C00150000") -> str:
+    return client.place_order(symbol, OrderType.LIMIT, OrderSide.BUY, Decimal("5"), price=Decimal("2"))
+
+
+def _ids_by_status(client: MockTigerClient):
+    return {status: list(ids) for status, ids in client._order_ids_by_status.items() if ids}
+
+
+class TestOrderStatusIndex:
+    def test_new_orders_are_indexed_as_submitted(self, client):
+        first = _place_limit(client)
+        second = _place_limit(client)
+
+        assert _ids_by_status(client) == {OrderStatus.SUBMITTED.value: [first, second]}
+        assert [o.order_id for o in client.get_orders(OrderStatus.SUBMITTED.value)] == [first, second]
+
+    def test_cancel_moves_order_between_statuses(self, client):
+        kept = _place_limit(client)
+        cancelled = _place_limit(client)
+
+        assert client.cancel_order(cancelled)
+
+        assert _ids_by_status(client) == {
+            OrderStatus.SUBMITTED.value: [kept],
+            OrderStatus.CANCELLED.value: [cancelled],
+        }
+        assert client.get_orders(OrderStatus.CANCELLED.value)[0].status == OrderStatus.CANCELLED
+        assert not client.cancel_order(cancelled)
+
+    def test_market_order_leaves_submitted(self, client):
+        order_id = client.place_order("AAPL  261218C00150000", OrderType.MARKET, OrderSide.BUY, Decimal("10"))
+
+        order = client.get_orders()[0]
+        assert order.order_id == order_id
+        assert order.status in (OrderStatus.FILLED, OrderStatus.PARTIAL_FILLED)
+        assert client.get_orders(OrderStatus.SUBMITTED.value) == []
+        assert _ids_by_status(client) == {order.status.value: [order_id]}
+
+    def test_unfiltered_orders_follow_placement_order(self, client):
+        order_ids = [_place_limit(client) for _ in range(3)]
+        client.cancel_order(order_ids[1])
+
+        assert [o.order_id for o in client.get_orders()] == order_ids
+        assert client.get_orders("no_such_status") == []
@@ -0,0 +1,170 @@
+"""
+Tests for order pricing in OrderStrategyService
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.models import OrderSide, OrderType
+from src.services.order_strategy import (
+    OrderStrategy,
+    OrderStrategyService,
+    _div_round,
+    _from_ticks,
+    _offset_ticks,
+    _to_ticks,
+)
+
+
+@pytest.fixture
+def service(account_config) -> OrderStrategyService:
+    return OrderStrategyService(account_config)
+
+
+class TestTickHelpers:
+    """Integer tick arithmetic"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (Decimal("2.5"), 25000),
+            (Decimal("1.00005"), 10000),  # half a tick rounds to the even tick
+            (Decimal("1.00015"), 10002),
+            (Decimal("-1.00005"), -10000),
+            (Decimal("0"), 0),
+            (0.1, 1000),  # floats go through str(), not their binary value
+            ("2.71", 27100),
+        ],
+    )
+    def test_to_ticks(self, value, expected):
+        assert _to_ticks(value) == expected
+
+    def test_from_ticks_round_trips(self):
+        assert _from_ticks(26050) == Decimal("2.6050")
+        assert _from_ticks(None) is None
+
+    @pytest.mark.parametrize(
+        "numerator, denominator, expected",
+        [
+            (10, 2, 5),
+            (5, 2, 2),  # 2.5 -> 2
+            (7, 2, 4),  # 3.5 -> 4
+            (-5, 2, -2),
+            (-7, 2, -4),
+            (10, 3, 3),
+            (11, 3, 4),
+            (0, 7, 0),
+        ],
+    )
+    def test_div_round_is_half_even(self, numerator, denominator, expected):
+        assert _div_round(numerator, denominator) == expected
+
+    @pytest.mark.parametrize(
+        "price_ticks, offset_ticks, expected",
+        [
+            (25000, 100, 25250),  # +1%
+            (27100, -100, 26829),  # -1%
+            (10001, 5000, 15002),  # 15001.5 -> even
+            (10003, 5000, 15004),  # 15004.5 -> even
+            (26050, 0, 26050),
+        ],
+    )
+    def test_offset_ticks(self, price_ticks, offset_ticks, expected):
+        assert _offset_ticks(price_ticks, offset_ticks) == expected
+
+
+class TestOrderPricing:
+    """Prices produced by each OrderStrategy"""
+
+    @pytest.mark.parametrize(
+        "strategy, side, expected",
+        [
+            (OrderStrategy.MARKET, OrderSide.BUY, None),
+            (OrderStrategy.LIMIT, OrderSide.BUY, 26050),
+            (OrderStrategy.LIMIT_MIDPOINT, OrderSide.BUY, 26050),
+            (OrderStrategy.LIMIT_MIDPOINT, OrderSide.SELL, 26050),
+            (OrderStrategy.LIMIT_AGGRESSIVE, OrderSide.BUY, 26829),
+            (OrderStrategy.LIMIT_AGGRESSIVE, OrderSide.SELL, 25250),
+            (OrderStrategy.LIMIT_CONSERVATIVE, OrderSide.BUY, 25250),
+            (OrderStrategy.LIMIT_CONSERVATIVE, OrderSide.SELL, 26829),
+            (OrderStrategy.STOP_LOSS, OrderSide.BUY, 26050),
+        ],
+    )
+    def test_calculate_order_price(self, service, make_contract, strategy, side, expected):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"), last=Decimal("2.60"))
+        assert service._calculate_order_price(contract, strategy, side) == expected
+
+    def test_midpoint_falls_back_to_last_price(self, service, make_contract):
+        contract = make_contract(bid=Decimal("2.50"), last=Decimal("2.60"))
+        assert service._calculate_order_price(contract, OrderStrategy.LIMIT_MIDPOINT, OrderSide.BUY) == 26000
+
+    def test_no_quotes_gives_no_price(self, service, make_contract, make_signal):
+        contract = make_contract()
+        assert service._calculate_order_price(contract, OrderStrategy.LIMIT_MIDPOINT, OrderSide.BUY) is None
+        assert service.create_order(make_signal(), contract, OrderStrategy.LIMIT) is None
+
+    @pytest.mark.parametrize("side, expected", [(OrderSide.BUY, 23445), (OrderSide.SELL, 28655)])
+    def test_stop_price(self, service, make_contract, side, expected):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"))
+        assert service._calculate_stop_price(contract, side) == expected
+
+    def test_create_stop_loss_order(self, service, make_contract, make_signal):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"))
+        order = service.create_order(make_signal("sell"), contract, OrderStrategy.STOP_LOSS)
+        assert order.order_type == OrderType.STOP
+        assert order.price == Decimal("2.6050")
+        assert order.stop_price == Decimal("2.8655")
+        assert service.validate_order_parameters(order) == (True, [])
+
+    def test_create_market_order_has_no_price(self, service, make_contract, make_signal):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"))
+        order = service.create_order(make_signal(), contract, OrderStrategy.MARKET)
+        assert order.order_type == OrderType.MARKET
+        assert order.price is None
+
+
+class TestBracketOrder:
+    """Entry, profit-target and stop-loss legs"""
+
+    @pytest.mark.parametrize(
+        "action, exit_side, entry, profit, stop",
+        [
+            ("buy", OrderSide.SELL, "2.1022", "2.5226", "1.8920"),
+            ("sell", OrderSide.BUY, "2.1022", "1.6818", "2.3124"),
+        ],
+    )
+    def test_legs(self, service, make_contract, make_signal, action, exit_side, entry, profit, stop):
+        # Midpoint 2.10225 rounds half-even to 2.1022; the exit legs are offset
+        # from that rounded entry, so the buy-side profit target is 2.5226
+        # rather than the 2.5227 an unrounded midpoint would give
+        contract = make_contract(bid=Decimal("2.1011"), ask=Decimal("2.1034"))
+        entry_leg, profit_leg, stop_leg = service.create_bracket_order(make_signal(action), contract)
+
+        assert entry_leg.price == Decimal(entry)
+        assert profit_leg.price == Decimal(profit)
+        assert stop_leg.stop_price == Decimal(stop)
+        assert stop_leg.price is None
+        assert profit_leg.side == stop_leg.side == exit_side
+        assert profit_leg.parent_order == stop_leg.parent_order == "entry"
+        assert len({entry_leg.created_at, profit_leg.created_at, stop_leg.created_at}) == 1
+
+    def test_rejects_non_positive_quantity(self, service, make_contract, make_signal):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"))
+        assert service.create_bracket_order(make_signal(quantity=Decimal("0")), contract) is None
+
+
+class TestOrdersBatch:
+    def test_shares_one_timestamp(self, service, make_contract, make_signal):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"))
+        signals = [make_signal(action, signal_id=f"sig-{i}") for i, action in enumerate(["buy", "sell", "buy"])]
+
+        orders = service.create_orders_batch(signals, [contract] * 3, OrderStrategy.LIMIT_AGGRESSIVE)
+
+        assert [order.price for order in orders] == [Decimal("2.6829"), Decimal("2.5250"), Decimal("2.6829")]
+        assert len({order.created_at for order in orders}) == 1
+
+    def test_rejects_mismatched_lengths(self, service, make_contract, make_signal):
+        contract = make_contract(bid=Decimal("2.50"), ask=Decimal("2.71"))
+        with pytest.raises(ValueError):
+            service.create_orders_batch([make_signal()], [contract, contract])
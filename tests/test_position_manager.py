@@ -0,0 +1,91 @@
+"""
+Tests for PositionManager metrics caching and expiry lookups
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.models import Position
+from src.models.tiger import Currency
+from src.services.position_manager import PositionManager
+
+
+def _position(symbol: str, quantity: str, market_value: str, unrealized_pnl: str = "0") -> Position:
+    return Position(
+        account="TEST001",
+        symbol=symbol,
+        quantity=Decimal(quantity),
+        avg_cost=Decimal("1"),
+        market_value=Decimal(market_value),
+        unrealized_pnl=Decimal(unrealized_pnl),
+        currency=Currency.USD,
+    )
+
+
+def _option_symbol(underlying: str, expiry: datetime, right: str = "C") -> str:
+    return f"{underlying:<6}{expiry:%y%m%d}{right}00150000"
+
+
+@pytest.fixture
+def manager(account_config) -> PositionManager:
+    manager = PositionManager(account_config)
+    manager.update_positions([
+        _position("AAPL  250117C00150000", "2", "500.5", "-20"),
+        _position("MSFT", "10", "3000"),
+    ])
+    return manager
+
+
+class TestPortfolioMetricsCache:
+    def test_repeated_calls_return_equal_metrics(self, manager):
+        first = manager.calculate_portfolio_metrics()
+        second = manager.calculate_portfolio_metrics()
+
+        assert first.pop("calculated_at") and second.pop("calculated_at")
+        assert first == second
+        assert first["total_market_value"] == 3500.5
+
+    def test_callers_get_independent_copies(self, manager):
+        first = manager.calculate_portfolio_metrics()
+        first["by_underlying"]["AAPL"]["market_value"] = 0
+        first["risk_metrics"].clear()
+
+        second = manager.calculate_portfolio_metrics()
+        assert second["by_underlying"]["AAPL"]["market_value"] == 500.5
+        assert second["risk_metrics"]
+
+    def test_update_positions_invalidates_cache(self, manager):
+        assert manager.calculate_portfolio_metrics()["total_positions"] == 2
+
+        manager.update_positions([_position("MSFT", "5", "1500")])
+
+        metrics = manager.calculate_portfolio_metrics()
+        assert metrics["total_positions"] == 1
+        assert metrics["total_market_value"] == 1500.0
+
+
+class TestExpiringPositions:
+    def test_returns_options_inside_window_soonest_first(self, account_config):
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        soon = _option_symbol("AAPL", today + timedelta(days=3))
+        sooner = _option_symbol("SPY", today + timedelta(days=1), "P")
+        later = _option_symbol("MSFT", today + timedelta(days=30))
+
+        manager = PositionManager(account_config)
+        manager.update_positions([
+            _position(later, "1", "100"),
+            _position(soon, "1", "100"),
+            _position("AAPL", "10", "1500"),
+            _position(sooner, "-1", "50"),
+        ])
+
+        assert [p.symbol for p in manager.get_expiring_positions(7)] == [sooner, soon]
+        assert [p.symbol for p in manager.get_expiring_positions(60)] == [sooner, soon, later]
+        assert manager.get_expiring_positions(0) == []
+
+    def test_no_options(self, account_config):
+        manager = PositionManager(account_config)
+        manager.update_positions([_position("AAPL", "10", "1500")])
+        assert manager.get_expiring_positions(365) == []